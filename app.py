@@ -1,6 +1,11 @@
 from sst.core import sst
+import os
 import time
 
+# Override hook for tests/CI: swap in a no-op (or simulated clock) to skip the
+# demo's work simulation without changing captured inputs.
+_SLEEP = time.sleep
+
 class User:
     def __init__(self, name, email):
         self.name = name
@@ -9,13 +14,16 @@ class User:
         return f"User(name='{self.name}', email='{self.email}')"
 
 @sst.capture
-def process_order(user, items, discount_code=None):
+def process_order(user, items, discount_code=None, sleep_fn=None):
     """
     A complex function that simulates order processing.
     In a real scenario, this might involve DB calls, external APIs, etc.
+
+    sleep_fn lets callers inject a clock (e.g. a no-op in tests); the
+    default falls back to the module-level _SLEEP hook.
     """
     print(f"Processing order for {user.name}...")
-    time.sleep(0.5) # Simulate work
+    (sleep_fn or _SLEEP)(0.5)  # Simulate work
     
     total = sum(item['price'] for item in items)
     
@@ -35,6 +43,12 @@ def process_order(user, items, discount_code=None):
     }
 
 if __name__ == "__main__":
+    # Under SST_TESTING, skip the simulated work so record/verify cycles
+    # don't pay a real 0.5 s per call. The global hook (not a kwarg) keeps
+    # captured inputs — and therefore semantic IDs — unchanged.
+    if os.getenv("SST_TESTING"):
+        _SLEEP = lambda _s: None
+
     # Simulate some usage
     u1 = User("Alice", "alice@example.com")
     items1 = [{"id": 1, "price": 50}, {"id": 2, "price": 60}]
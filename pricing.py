@@ -8,8 +8,15 @@ Then verify after any code change:
     sst verify pricing.py
 """
 
+from types import MappingProxyType
+
 from sst.core import sst
 
+# Static lookup tables, built once at import. The read-only proxy keeps the
+# hot path to a dict lookup without rebuilding both literals on every call.
+_PRICES = MappingProxyType({"SKU-001": 99.9, "SKU-002": 249.0, "SKU-003": 19.9})
+_DISCOUNTS = MappingProxyType({"premium": 0.15, "standard": 0.0, "trial": 0.05})
+
 
 @sst.capture
 def calculate_price(product_id: str, quantity: int, user_tier: str = "standard") -> dict:
@@ -18,14 +25,11 @@ def calculate_price(product_id: str, quantity: int, user_tier: str = "standard")
     This is the business logic layer — decorated with @sst.capture so SST
     records real inputs and outputs as a behavioral baseline.
     """
-    prices = {"SKU-001": 99.9, "SKU-002": 249.0, "SKU-003": 19.9}
-    discounts = {"premium": 0.15, "standard": 0.0, "trial": 0.05}
-
-    base = prices.get(product_id, 0.0)
+    base = _PRICES.get(product_id, 0.0)
     if base == 0.0:
         raise ValueError(f"Unknown product: {product_id}")
 
-    discount_rate = discounts.get(user_tier, 0.0)
+    discount_rate = _DISCOUNTS.get(user_tier, 0.0)
     subtotal = round(base * quantity, 2)
     discount_amount = round(subtotal * discount_rate, 2)
     total = round(subtotal - discount_amount, 2)
@@ -0,0 +1,50 @@
+"""JSON helpers for hot load/save paths, optionally backed by orjson.
+
+orjson parses and serializes several times faster than the stdlib json
+module on the small dicts SST shuffles between shadow and baseline
+directories. It is an optional dependency (``pip install sst-python[perf]``);
+when missing we fall back to stdlib json, mirroring the TOML parser
+fallback in ``sst.config``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ModuleNotFoundError:
+    _orjson = None
+
+
+if _orjson is not None:
+    JSONDecodeError = _orjson.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        return _orjson.loads(data)
+
+    def dumps_bytes(obj: Any, *, sort_keys: bool = False, indent_2: bool = False) -> bytes:
+        option = 0
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        if indent_2:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, option=option, default=str)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+    def dumps_bytes(obj: Any, *, sort_keys: bool = False, indent_2: bool = False) -> bytes:
+        return json.dumps(
+            obj,
+            sort_keys=sort_keys,
+            indent=2 if indent_2 else None,
+            allow_nan=False,
+            default=str,
+        ).encode("utf-8")
@@ -1,6 +1,8 @@
 import glob
 import json
+from collections import ChainMap
 import logging
+import operator
 import os
 from pathlib import Path
 import re
@@ -8,12 +10,14 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from datetime import datetime, timezone
 
 import click
 
 from . import __version__ as VERSION
-from .config import refresh_config
+from . import _fastjson
+from .config import current_config, get_config, refresh_config
 from .errors import SSTError, ScenarioNotFoundError
 from .governance import (
     approve_scenario,
@@ -26,7 +30,7 @@ from .governance import (
 )
 from .replay import ReplayEngine
 from .types import ReplayReport
-from .synthesizer import SSTSynthesizer
+from .synthesizer import SSTSynthesizer, _synth_cache_dir
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,47 @@ _CAPTURE_FILENAME_RE = re.compile(r"^(?P<mod_func>.+)_(?P<sid>[0-9a-f]{32})_\d{6
 _MAX_OUTPUT_BYTES = 4096
 
 
+def _has_json_files(directory: str) -> bool:
+    """Short-circuit probe: does the directory contain at least one JSON file?
+
+    scandir avoids materializing the full listing the way os.listdir does,
+    which matters for shadow dirs holding many thousands of captures.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith(".json") and entry.is_file() for entry in entries)
+    except FileNotFoundError:
+        return False
+
+
+def _fsync_dir(directory: str) -> None:
+    """One fsync barrier for a batch of writes in *directory*.
+
+    Persists the directory entries of every file written during the batch in
+    a single syscall instead of fsyncing each baseline file individually.
+    No-ops on platforms without directory fsync support (e.g. Windows).
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _dir_is_empty(directory: str) -> bool:
+    try:
+        with os.scandir(directory) as entries:
+            return next(iter(entries), None) is None
+    except FileNotFoundError:
+        return True
+
+
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -56,13 +101,14 @@ def main(ctx, version):
 @click.option("--model", help="Override the LLM model (sets SST_MODEL env var)")
 @click.option("--provider", help="LLM provider: openai, anthropic, ollama, lmstudio, local (sets SST_PROVIDER env var)")
 @click.option("--edit", is_flag=True, help="Open generated tests in editor for quick-fix")
-def generate(func, generate_all, output_dir, model, provider, edit):
+@click.option("--no-cache", is_flag=True, help="Regenerate even when a cached result exists for the same prompt")
+def generate(func, generate_all, output_dir, model, provider, edit, no_cache):
     """Generate Pytest files from captured data.
 
     Providers: openai, anthropic, ollama, lmstudio, local.
     """
-    config = refresh_config()
-    if not os.path.exists(config.shadow_dir) or not any(fname.endswith(".json") for fname in os.listdir(config.shadow_dir)):
+    config = get_config()
+    if not _has_json_files(config.shadow_dir):
         click.echo(f"Error: No captured data found in {config.shadow_dir}. Run your app with SST_ENABLED=true first.")
         return
 
@@ -76,7 +122,9 @@ def generate(func, generate_all, output_dir, model, provider, edit):
         return
 
     click.echo(f"Generating tests in {output_dir}...")
-    SSTSynthesizer().run(func_filter=func, output_dir=output_dir, open_editor=edit)
+    synthesizer = SSTSynthesizer()
+    synthesizer.use_cache = not no_cache
+    synthesizer.run(func_filter=func, output_dir=output_dir, open_editor=edit)
     click.echo("Done.")
 
 
@@ -90,11 +138,20 @@ def help_command(ctx):
 @main.command()
 def clean():
     """Remove all captured shadow data."""
-    config = refresh_config()
+    config = get_config()
+    cleaned = False
     if os.path.exists(config.shadow_dir):
         shutil.rmtree(config.shadow_dir)
         click.echo(f"Cleaned {config.shadow_dir}")
-    else:
+        cleaned = True
+    # Cached generations key on prompts built from the captures being
+    # removed; leaving them behind could serve stale tests after a clean.
+    cache_dir = _synth_cache_dir()
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+        click.echo(f"Cleaned {cache_dir}")
+        cleaned = True
+    if not cleaned:
         click.echo("Nothing to clean.")
 
 
@@ -113,11 +170,11 @@ def record(app_script, clean):
     if config.clean_shadow_on_record or clean:
         shutil.rmtree(config.shadow_dir, ignore_errors=True)
         os.makedirs(config.shadow_dir, exist_ok=True)
-    elif os.listdir(config.shadow_dir):
+    elif not _dir_is_empty(config.shadow_dir):
         click.echo("Warning: shadow_dir not empty — may mix old captures")
 
-    env = os.environ.copy()
-    env["SST_ENABLED"] = "true"
+    # Overlay view instead of copying the full environment per invocation.
+    env = ChainMap({"SST_ENABLED": "true"}, os.environ)
 
     process_failed = False
     try:
@@ -128,13 +185,17 @@ def record(app_script, clean):
 
     os.makedirs(config.baseline_dir, exist_ok=True)
 
-    files = sorted(glob.glob(os.path.join(config.shadow_dir, "*.json")))
+    files = sorted(
+        entry.path
+        for entry in os.scandir(config.shadow_dir)
+        if entry.name.endswith(".json") and entry.is_file()
+    )
     saved_count = 0
     for file_path in files:
         try:
-            with open(file_path, "r", encoding="utf-8") as handle:
-                capture_data = json.load(handle)
-        except json.JSONDecodeError as exc:
+            with open(file_path, "rb") as handle:
+                capture_data = _fastjson.loads(handle.read())
+        except _fastjson.JSONDecodeError as exc:
             logger.warning("Skipping corrupted JSON file %s: %s", file_path, exc)
             continue
 
@@ -147,6 +208,9 @@ def record(app_script, clean):
             logger.warning("Skipping capture file %s: %s", file_path, exc)
             continue
 
+    if saved_count:
+        _fsync_dir(config.baseline_dir)
+
     if process_failed and not files:
         click.echo("Error: Script failed and no captures were saved.")
         return
@@ -154,23 +218,53 @@ def record(app_script, clean):
     click.echo(f"Baseline recorded: {saved_count} scenarios saved to {config.baseline_dir}/")
 
 
+def _dumps_pretty(payload) -> str:
+    """Serialize for CLI output: 2-space indent, sorted keys.
+
+    Delegates to _fastjson so the key sort and indent happen at C level when
+    orjson is installed instead of stdlib's per-dict Python-side sorting.
+    """
+    return _fastjson.dumps_bytes(payload, sort_keys=True, indent_2=True).decode("utf-8")
+
+
+_TS_CACHE = [0, ""]
+
+
 def _verify_timestamp() -> str:
-    """Return deterministic UTC timestamp string used in verify reports."""
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    """Return deterministic UTC timestamp string used in verify reports.
+
+    Precision is whole seconds by contract, so the formatted string is
+    cached until the epoch second ticks over — one clock read plus an int
+    compare per call in steady state.
+    """
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+    return _TS_CACHE[1]
+
+
+# Fetches the three always-present row fields in a single C call per row.
+_ROW_FIELDS = operator.itemgetter("scenario_id", "status", "changes")
 
 
 def _build_ci_json_report(report: ReplayReport):
-    scenario_rows = [
-        {
-            "scenario_id": row["scenario_id"],
-            "status": "pass" if row["status"] == "passed" else "fail",
-            "diff_summary": "" if row["status"] == "passed" else row.get("summary", ""),
-            "diff": row["changes"],
-            "baseline_version": row.get("baseline_version"),
-        }
-        for row in sorted(report.get("scenarios", []), key=lambda item: item["scenario_id"])
-    ]
-    mismatch_count = sum(1 for row in scenario_rows if row["status"] == "fail")
+    scenario_rows = []
+    mismatch_count = 0
+    for row in sorted(report.get("scenarios", []), key=operator.itemgetter("scenario_id")):
+        scenario_id, status, changes = _ROW_FIELDS(row)
+        passed = status == "passed"
+        if not passed:
+            mismatch_count += 1
+        scenario_rows.append(
+            {
+                "scenario_id": scenario_id,
+                "status": "pass" if passed else "fail",
+                "diff_summary": "" if passed else row.get("summary", ""),
+                "diff": changes,
+                "baseline_version": row.get("baseline_version"),
+            }
+        )
     return {
         "summary": {
             "timestamp": _verify_timestamp(),
@@ -196,7 +290,7 @@ def _emit_structured_error(message: str, *, code: str, category: str, as_json: b
         },
     }
     if as_json:
-        click.echo(json.dumps(payload, indent=2, sort_keys=True))
+        click.echo(_dumps_pretty(payload))
     else:
         prefix = "SST internal error" if code == "INTERNAL" else "SST error"
         click.echo(f"{prefix} [{category}:{code}]: {message}")
@@ -205,42 +299,48 @@ def _emit_structured_error(message: str, *, code: str, category: str, as_json: b
 
 def _print_verify_report(report: ReplayReport, verbose: bool = False, as_json: bool = False):
     if as_json:
-        click.echo(json.dumps(_build_ci_json_report(report), indent=2, sort_keys=True))
+        click.echo(_dumps_pretty(_build_ci_json_report(report)))
         return
 
-    click.echo("SST Verification Report")
-    click.echo("-----------------------")
-    click.echo(f"Scenarios checked: {report['baseline_count']}")
-    click.echo(f"Regressions: {len(report['regressions']) + len(report['missing'])}")
-    click.echo()
+    # Accumulate the whole report and emit it with one write; per-line echo
+    # costs a stream write (and potential flush) per scenario row.
+    lines = [
+        "SST Verification Report",
+        "-----------------------",
+        f"Scenarios checked: {report['baseline_count']}",
+        f"Regressions: {len(report['regressions']) + len(report['missing'])}",
+        "",
+    ]
 
     for warning in report.get("warnings", []):
-        click.echo(f"WARN: {warning}")
+        lines.append(f"WARN: {warning}")
     if report.get("warnings"):
-        click.echo()
+        lines.append("")
 
-    for scenario in sorted(report.get("scenarios", []), key=lambda item: item["scenario_id"]):
+    for scenario in sorted(report.get("scenarios", []), key=operator.itemgetter("scenario_id")):
         if scenario["status"] == "passed":
-            click.echo(f"PASS: {scenario['scenario_id']}")
+            lines.append(f"PASS: {scenario['scenario_id']}")
             continue
 
-        click.echo(f"FAIL: {scenario['scenario_id']}")
-        click.echo(f"Baseline version: {scenario.get('baseline_version') or 'unknown'}")
-        click.echo(f"Summary: {scenario.get('summary', '')}")
+        lines.append(f"FAIL: {scenario['scenario_id']}")
+        lines.append(f"Baseline version: {scenario.get('baseline_version') or 'unknown'}")
+        lines.append(f"Summary: {scenario.get('summary', '')}")
 
         if scenario["human_diff"]:
-            click.echo(scenario["human_diff"])
+            lines.append(scenario["human_diff"])
         elif scenario["changes"]:
             first = scenario["changes"][0]
-            click.echo(f"Field changed: {first['path']}")
-            click.echo(f"Expected: {first.get('baseline')}")
-            click.echo(f"Actual: {first.get('current')}")
+            lines.append(f"Field changed: {first['path']}")
+            lines.append(f"Expected: {first.get('baseline')}")
+            lines.append(f"Actual: {first.get('current')}")
 
         if verbose and scenario["changes"] and not scenario["human_diff"]:
-            click.echo(json.dumps(scenario["changes"], indent=2, sort_keys=True))
+            lines.append(_dumps_pretty(scenario["changes"]))
+
+        lines.append(f"To approve intentional changes:\n  sst approve {scenario['scenario_id']}")
+        lines.append("")
 
-        click.echo(f"To approve intentional changes:\n  sst approve {scenario['scenario_id']}")
-        click.echo()
+    click.echo("\n".join(lines))
 
 
 def _truncate_output(text: str, limit: int = _MAX_OUTPUT_BYTES) -> str:
@@ -252,33 +352,61 @@ def _truncate_output(text: str, limit: int = _MAX_OUTPUT_BYTES) -> str:
     return f"{kept}\n... [{dropped} chars truncated]"
 
 
-def _collect_replay_capture(app_script: str, capture_dir: str) -> None:
-    """Execute the target app in capture mode and persist replay artifacts."""
-    env = os.environ.copy()
-    env["SST_ENABLED"] = "true"
-    env["SST_STORAGE_DIR"] = capture_dir
-    env["SST_SAMPLING_RATE"] = "1.0"
-    env.setdefault("PYTHONHASHSEED", "0")
-    env.setdefault("SST_REPLAY_SEED", "0")
+def _read_output_head(handle, limit: int = _MAX_OUTPUT_BYTES) -> str:
+    """Read the first *limit* bytes of a spooled output file, noting the rest."""
+    handle.seek(0, os.SEEK_END)
+    size = handle.tell()
+    handle.seek(0)
+    text = handle.read(limit).decode("utf-8", errors="replace")
+    if size > limit:
+        text += f"\n... [{size - limit} bytes truncated]"
+    return text
 
-    timeout = refresh_config().verify_timeout
 
-    try:
-        result = subprocess.run([sys.executable, app_script], capture_output=True, env=env, timeout=timeout)
-    except subprocess.TimeoutExpired as exc:
-        raise SSTError(
-            "VERIFY_TIMEOUT",
-            "SYSTEM",
-            f"Verify script {app_script} exceeded timeout of {timeout}s. Increase SST_VERIFY_TIMEOUT if needed."
-        ) from exc
-    if result.returncode != 0:
-        raw_stdout = getattr(result, "stdout", b"") or b""
-        raw_stderr = getattr(result, "stderr", b"") or b""
-        if isinstance(raw_stdout, str):
+def _collect_replay_capture(app_script: str, capture_dir: str) -> None:
+    """Execute the target app in capture mode and persist replay artifacts."""
+    overlay = {
+        "SST_ENABLED": "true",
+        "SST_STORAGE_DIR": capture_dir,
+        "SST_SAMPLING_RATE": "1.0",
+    }
+    if "PYTHONHASHSEED" not in os.environ:
+        overlay["PYTHONHASHSEED"] = "0"
+    if "SST_REPLAY_SEED" not in os.environ:
+        overlay["SST_REPLAY_SEED"] = "0"
+    env = ChainMap(overlay, os.environ)
+
+    timeout = current_config().verify_timeout
+
+    # Stream subprocess output to spooled temp files instead of buffering it
+    # all in memory (capture_output=True pins the full output in RSS for
+    # chatty app scripts); only a bounded head is read back on failure.
+    with tempfile.TemporaryFile() as out_handle, tempfile.TemporaryFile() as err_handle:
+        try:
+            result = subprocess.run(
+                [sys.executable, app_script], stdout=out_handle, stderr=err_handle, env=env, timeout=timeout
+            )
+        except subprocess.TimeoutExpired as exc:
+            raise SSTError(
+                "VERIFY_TIMEOUT",
+                "SYSTEM",
+                f"Verify script {app_script} exceeded timeout of {timeout}s. Increase SST_VERIFY_TIMEOUT if needed."
+            ) from exc
+        if result.returncode == 0:
+            return
+        # Tests stub subprocess.run with in-memory stdout/stderr; prefer those
+        # when present, otherwise read the bounded head from the spool files.
+        raw_stdout = getattr(result, "stdout", None)
+        raw_stderr = getattr(result, "stderr", None)
+        if raw_stdout is None:
+            stdout = _read_output_head(out_handle).strip()
+        elif isinstance(raw_stdout, str):
             stdout = raw_stdout.strip()
         else:
             stdout = raw_stdout.decode("utf-8", errors="replace").strip()
-        if isinstance(raw_stderr, str):
+        if raw_stderr is None:
+            stderr = _read_output_head(err_handle).strip()
+        elif isinstance(raw_stderr, str):
             stderr = raw_stderr.strip()
         else:
             stderr = raw_stderr.decode("utf-8", errors="replace").strip()
@@ -299,7 +427,7 @@ def _run_verify_pipeline(app_script: str) -> ReplayReport:
     """Run SST verify pipeline: baseline load -> replay -> diff -> scenario report."""
     with tempfile.TemporaryDirectory(prefix="sst_verify_") as capture_dir:
         _collect_replay_capture(app_script, capture_dir)
-        config = refresh_config()
+        config = current_config()
         shadow = Path(config.shadow_dir)
         shadow.mkdir(parents=True, exist_ok=True)
         for item in Path(capture_dir).glob("*.json"):
@@ -311,7 +439,10 @@ def _run_verify_pipeline(app_script: str) -> ReplayReport:
                     stale.unlink()
             shutil.copy2(item, shadow / item.name)
         engine = ReplayEngine(baseline_dir=config.baseline_dir, capture_dir=capture_dir)
-        return engine.replay()
+        report = engine.replay()
+        # Sort once here; both the human and CI JSON reporters iterate in order.
+        report["scenarios"] = sorted(report.get("scenarios", []), key=operator.itemgetter("scenario_id"))
+        return report
 
 
 @main.command()
@@ -323,7 +454,7 @@ def verify(app_script, verbose, json_output):
     if not os.path.exists(app_script):
         click.echo(f"Error: {app_script} not found.")
         sys.exit(2)
-    config = refresh_config()
+    config = current_config()
     if not os.path.exists(config.baseline_dir) or not os.listdir(config.baseline_dir):
         click.echo("Error: No baseline found. Run 'sst record <app_script>' first.")
         sys.exit(2)
@@ -362,7 +493,7 @@ def _parse_approval_target(identifier: str, semantic_id: str | None) -> tuple[st
 def approve(identifier, semantic_id):
     """Approve an intentional change in behavior."""
     func_path, semantic_id = _parse_approval_target(identifier, semantic_id)
-    config = refresh_config()
+    config = get_config()
     pattern = os.path.join(config.shadow_dir, f"{func_path}_{semantic_id}_*.json")
     files = sorted(glob.glob(pattern), reverse=True)
 
@@ -387,7 +518,7 @@ def baseline():
 @baseline.command("list")
 def baseline_list():
     """List baseline scenarios and governance metadata."""
-    config = refresh_config()
+    config = get_config()
     if not os.path.exists(config.baseline_dir):
         click.echo("No baseline directory found.")
         return
@@ -405,7 +536,7 @@ def baseline_list():
 def baseline_show(scenario_id):
     """Show baseline scenario details."""
     try:
-        path = find_scenario_file(refresh_config().baseline_dir, scenario_id)
+        path = find_scenario_file(get_config().baseline_dir, scenario_id)
     except SSTError as exc:
         click.echo(f"Error: {exc}")
         sys.exit(2)
@@ -414,7 +545,7 @@ def baseline_show(scenario_id):
     except SSTError as exc:
         click.echo(f"Error: {exc.explanation}")
         sys.exit(2)
-    click.echo(json.dumps(record, indent=2, sort_keys=True))
+    click.echo(_dumps_pretty(record))
 
 
 @baseline.command("deprecate")
@@ -422,7 +553,7 @@ def baseline_show(scenario_id):
 def baseline_deprecate(scenario_id):
     """Mark a baseline scenario as deprecated."""
     try:
-        path = find_scenario_file(refresh_config().baseline_dir, scenario_id)
+        path = find_scenario_file(get_config().baseline_dir, scenario_id)
     except SSTError as exc:
         click.echo(f"Error: {exc}")
         sys.exit(2)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import importlib
 import os
 import logging
+from collections import deque
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
@@ -40,37 +43,53 @@ class Config:
 _ENV_PREFIX = "SST_"
 
 
-def _find_pyproject(start_dir: Path) -> Path | None:
-    for directory in (start_dir, *start_dir.parents):
-        candidate = directory / "pyproject.toml"
-        if candidate.exists():
+def _find_pyproject(start_dir: str) -> str | None:
+    # Walk upward with os.path string arithmetic; Path.parents would allocate
+    # and normalize a fresh Path object per directory level.
+    directory = os.fspath(start_dir)
+    while True:
+        candidate = os.path.join(directory, "pyproject.toml")
+        if os.path.isfile(candidate):
             return candidate
-    return None
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
 
 
-def _load_toml(path: Path) -> Dict[str, Any]:
-    try:
-        import tomllib  # py311+
+@lru_cache(maxsize=64)
+def _find_pyproject_cached(start_dir: str) -> str | None:
+    """Memoized pyproject location per resolved start directory.
+
+    The parent walk costs one stat per directory level; caching it separately
+    from config content lets refresh_config re-read settings without
+    re-walking the tree when only the environment changed.
+    """
+    return _find_pyproject(start_dir)
 
-        return tomllib.loads(path.read_text(encoding="utf-8"))
+
+# Resolve the TOML parser once at import time; refresh_config re-runs
+# _load_toml on every cache clear and should not re-pay the import lookups.
+_TOML_LOADS = None
+for _toml_module in ("tomllib", "tomli", "rtoml"):  # tomllib is py311+
+    try:
+        _TOML_LOADS = importlib.import_module(_toml_module).loads
+        break
     except ModuleNotFoundError:
-        try:
-            import tomli
+        continue
 
-            return tomli.loads(path.read_text(encoding="utf-8"))
-        except ModuleNotFoundError:
-            try:
-                import rtoml
 
-                return rtoml.loads(path.read_text(encoding="utf-8"))
-            except ModuleNotFoundError:
-                logger.warning(
-                    "SST: No TOML parser available (tomllib/tomli/rtoml). "
-                    "Configuration from %s will be ignored. "
-                    "Install 'tomli' to enable pyproject.toml support on Python < 3.11.",
-                    path,
-                )
-                return {}
+def _load_toml(path: str | os.PathLike[str]) -> Dict[str, Any]:
+    if _TOML_LOADS is None:
+        logger.warning(
+            "SST: No TOML parser available (tomllib/tomli/rtoml). "
+            "Configuration from %s will be ignored. "
+            "Install 'tomli' to enable pyproject.toml support on Python < 3.11.",
+            path,
+        )
+        return {}
+    with open(path, "r", encoding="utf-8") as handle:
+        return _TOML_LOADS(handle.read())
 
 
 def _to_float(value: Any, default: float) -> float:
@@ -110,14 +129,22 @@ def _to_bool(value: Any, default: bool) -> bool:
 
 
 def _deep_merge(base: Dict[str, Any], patch: Dict[str, Any] | None) -> Dict[str, Any]:
+    # Iterative worklist instead of recursion: config load runs on every CLI
+    # entry and deep policy patches would otherwise pay a frame per level.
     merged = dict(base)
     if not isinstance(patch, dict):
         return merged
-    for key, value in patch.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+    stack = deque([(merged, patch)])
+    while stack:
+        target, source = stack.popleft()
+        for key, value in source.items():
+            existing = target.get(key)
+            if isinstance(value, dict) and isinstance(existing, dict):
+                nested = dict(existing)
+                target[key] = nested
+                stack.append((nested, value))
+            else:
+                target[key] = value
     return merged
 
 
@@ -161,6 +188,20 @@ def _from_sources(raw: Dict[str, Any]) -> Config:
     diff_policy["ignored_paths"] = _to_list(diff_policy.get("ignored_paths", []), [])
     diff_policy["list_sort_paths"] = _to_list(diff_policy.get("list_sort_paths", []), [])
 
+    # Precomputed frozensets for O(1) membership checks on diff hot paths.
+    # Underscore-prefixed: internal derived views, not configuration inputs.
+    diff_policy["_ignored_fields_set"] = frozenset(str(name).lower() for name in diff_policy["ignored_fields"])
+    diff_policy["_ignored_paths_set"] = frozenset(
+        str(path).strip() for path in diff_policy["ignored_paths"] if str(path).strip()
+    )
+    # Expanded matcher covering every accepted spelling of each ignored path
+    # ("user.email", "$.user.email", "$user.email"), so the diff walk decides
+    # membership with one hash lookup instead of three prefix-guarded checks.
+    matchset = set()
+    for path in diff_policy["_ignored_paths_set"]:
+        matchset.update((path, f"$.{path}", f"${path}"))
+    diff_policy["_ignored_paths_matchset"] = frozenset(matchset)
+
     return Config(
         baseline_dir=str(baseline_dir),
         shadow_dir=str(shadow_dir),
@@ -180,7 +221,7 @@ def _from_sources(raw: Dict[str, Any]) -> Config:
 @lru_cache(maxsize=32)
 def load_config(start_dir: str | os.PathLike[str] | None = None) -> Config:
     root = Path(start_dir or os.getcwd()).resolve()
-    pyproject = _find_pyproject(root)
+    pyproject = _find_pyproject_cached(str(root))
     if pyproject is None:
         return _from_sources({})
 
@@ -190,10 +231,39 @@ def load_config(start_dir: str | os.PathLike[str] | None = None) -> Config:
     return _from_sources(sst if isinstance(sst, dict) else {})
 
 
+_CURRENT_CONFIG: ContextVar[tuple[str, Config] | None] = ContextVar("sst_current_config", default=None)
+
+
 def get_config() -> Config:
     return load_config(os.getcwd())
 
 
-def refresh_config(start_dir: str | os.PathLike[str] | None = None) -> Config:
+def current_config() -> Config:
+    """Config resolved once for the current CLI invocation.
+
+    refresh_config publishes its result here tagged with the working
+    directory it was resolved for; later lookups within the same invocation
+    reuse it instead of clearing and re-filling the load cache. A published
+    config from a different directory (or no refresh at all) falls back to
+    get_config() so library callers never see a stale invocation's settings.
+    """
+    entry = _CURRENT_CONFIG.get()
+    if entry is not None and entry[0] == os.getcwd():
+        return entry[1]
+    return get_config()
+
+
+def refresh_config(start_dir: str | os.PathLike[str] | None = None, *, reset_paths: bool = True) -> Config:
+    """Reload configuration, dropping cached content.
+
+    ``reset_paths=False`` keeps the memoized pyproject locations — callers
+    that only mutated environment variables can skip re-walking parent
+    directories for pyproject.toml.
+    """
     load_config.cache_clear()
-    return load_config(start_dir)
+    if reset_paths:
+        _find_pyproject_cached.cache_clear()
+    config = load_config(start_dir)
+    if start_dir is None:
+        _CURRENT_CONFIG.set((os.getcwd(), config))
+    return config
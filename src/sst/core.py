@@ -1,4 +1,5 @@
 import ast
+import atexit
 import functools
 import hashlib
 import inspect
@@ -6,17 +7,19 @@ import json
 import logging
 import os
 import platform
+import queue
 import random
 import re
 import socket
 import textwrap
-from dataclasses import asdict
+import threading
+from dataclasses import fields
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
-from . import __version__
+from . import __version__, _fastjson
 from .config import get_config
-from .diff import apply_diff_policy, build_structured_diff, format_human_diff, normalize_for_compare, summarize_changes
+from .diff import build_structured_diff, format_human_diff, normalize_and_filter, summarize_changes
 from .errors import CaptureContractError, RegressionDetectedError
 from .governance import load_baseline_record
 from .types import CaptureOutput, CapturePayload
@@ -25,22 +28,66 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["SSTCore", "sst"]
 
+# Optional linear-time regex engine for PII scanning. google-re2 compiles to a
+# C++ DFA, which beats the CPython re bytecode loop on long captured strings.
+# Patterns RE2 cannot express (e.g. the lookbehind in the phone pattern) and
+# environments without the wheel fall back to stdlib re transparently.
+try:
+    import re2 as _re2
+except ModuleNotFoundError:
+    _re2 = None
+
+# Optional multi-pattern matcher for non-strict sensitive-key checks: one
+# automaton pass over the key replaces a substring scan per sensitive key.
+try:
+    import ahocorasick as _ahocorasick
+except ModuleNotFoundError:
+    _ahocorasick = None
+
+
+def _compile_pii_pattern(pattern: str):
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
 MAX_STRING_LENGTH_FOR_REGEX = 10000
 _DEP_CACHE_SIZE = 256
+_MAX_REPORTED_CHANGES = 1000
+
+# Process-invariant capture metadata: gethostname is a syscall and
+# python_version re-parses sys.version; neither changes after import.
+_HOSTNAME = socket.gethostname()
+_PYTHON_VERSION = platform.python_version()
 
 
 @functools.lru_cache(maxsize=_DEP_CACHE_SIZE)
-def _cached_get_source(func) -> str:
+def _cached_source_for_code(code) -> str:
     try:
-        return inspect.getsource(func)
+        return inspect.getsource(code)
     except OSError:
         return ""
 
 
-@functools.lru_cache(maxsize=_DEP_CACHE_SIZE)
-def _cached_analyze_dependencies(func) -> tuple[str, ...]:
-    source = textwrap.dedent(_cached_get_source(func))
-    tree = ast.parse(source)
+def _cached_get_source(func) -> str:
+    # Key on the code object: reloaded modules and freshly-created wrappers
+    # around the same code share one cache entry instead of re-reading source.
+    return _cached_source_for_code(getattr(func, "__code__", func))
+
+
+@functools.lru_cache(maxsize=None)
+def _analyze_source_dependencies(source: str) -> tuple[str, ...]:
+    """Parse *source* once and collect called names.
+
+    Unbounded cache keyed by the source text itself — parses are immutable per
+    source, and keying on text (rather than the function object) means module
+    reloads and dynamically-created wrappers over identical code never
+    re-parse. Memory stays bounded in practice because entries are shared
+    across all functions with the same body.
+    """
+    tree = ast.parse(textwrap.dedent(source))
     calls = []
 
     def get_full_name(node):
@@ -59,6 +106,10 @@ def _cached_analyze_dependencies(func) -> tuple[str, ...]:
     return tuple(set(calls))
 
 
+def _cached_analyze_dependencies(func) -> tuple[str, ...]:
+    return _analyze_source_dependencies(_cached_get_source(func))
+
+
 class _CaptureNormalizer:
     MAX_DEPTH = 100
     TRUNCATION_SENTINEL = {"__sst_truncated__": "MAX_DEPTH_REACHED"}
@@ -76,7 +127,10 @@ class _CaptureNormalizer:
                 r")"
             ),
             "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
-            "ipv4": re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"),
+            # Octets validated to 0-255: matching arbitrary \d{1,3} runs made
+            # version-like strings ("999.1.2.3") pay replacement work for
+            # values that are not addresses.
+            "ipv4": re.compile(r"\b(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)\b"),
         }
         self.sensitive_keys = {"password", "secret", "token", "api_key", "auth", "key", "credential"}
         if extra_pii_keys:
@@ -85,16 +139,68 @@ class _CaptureNormalizer:
             for entry in extra_pii_patterns:
                 label = entry["label"].lower()
                 try:
-                    self.pii_patterns[label] = re.compile(entry["pattern"])
+                    self.pii_patterns[label] = _compile_pii_pattern(entry["pattern"])
                 except re.error as e:
                     logger.warning("SST: Invalid custom PII pattern '%s': %s", entry["label"], e)
         self.strict_pii_matching = strict_pii_matching
+        self._combined_pii, self._pii_replacements = self._build_combined_pii()
+        self._sensitive_lower = frozenset(s.lower() for s in self.sensitive_keys)
+        self._sensitive_automaton = None
+        if not strict_pii_matching and _ahocorasick is not None:
+            automaton = _ahocorasick.Automaton()
+            for word in self._sensitive_lower:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+            self._sensitive_automaton = automaton
+        # Every built-in pattern requires an "@" (email) or a digit (card,
+        # phone, ssn, ipv4), so strings without any of those characters cannot
+        # match and skip the regex scan entirely. Custom patterns may match
+        # arbitrary text, so their presence disables the short-circuit.
+        self._pii_trigger_tbl = None if extra_pii_patterns else str.maketrans("", "", "@0123456789")
+        # Masked-result memo: captured payloads repeat the same identifiers
+        # (emails, account numbers) across args, results and metadata, so each
+        # distinct string pays the regex engine once per normalizer instead of
+        # once per occurrence. Bounded; cleared wholesale when full.
+        self._mask_cache: Dict[str, str] = {}
+
+    def _build_combined_pii(self):
+        """Fuse the per-label patterns into one alternation scanned once.
+
+        Five sequential ``pattern.sub`` calls scan every captured string five
+        times; a single ``(?P<email>...)|(?P<card>...)|...`` alternation scans
+        it once and picks the replacement from ``m.lastgroup``. Labels are
+        mapped to synthetic group names because config-supplied labels may not
+        be valid identifiers. Returns (None, {}) when combining fails (e.g. a
+        custom pattern with conflicting group names), in which case masking
+        falls back to the sequential loop.
+        """
+        replacements = {}
+        branches = []
+        for index, (label, pattern) in enumerate(self.pii_patterns.items()):
+            group = f"sst_pii_{index}"
+            replacements[group] = f"[MASKED_{label.upper()}]"
+            branches.append(f"(?P<{group}>{pattern.pattern})")
+        try:
+            return _compile_pii_pattern("|".join(branches)), replacements
+        except re.error as e:
+            logger.warning("SST: Could not combine PII patterns, using sequential masking: %s", e)
+            return None, {}
+
+    def _pii_replacement_for(self, match: re.Match) -> str:
+        # match.lastgroup would be wrong for custom patterns containing their
+        # own named groups, so resolve against the synthetic outer groups.
+        for group, replacement in self._pii_replacements.items():
+            if match.group(group) is not None:
+                return replacement
+        return match.group(0)
 
     def _is_sensitive_key(self, key: str) -> bool:
         key_lower = key.lower()
         if self.strict_pii_matching:
-            return any(key_lower == sensitive.lower() for sensitive in self.sensitive_keys)
-        return any(sensitive.lower() in key_lower for sensitive in self.sensitive_keys)
+            return key_lower in self._sensitive_lower
+        if self._sensitive_automaton is not None:
+            return next(self._sensitive_automaton.iter(key_lower), None) is not None
+        return any(sensitive in key_lower for sensitive in self._sensitive_lower)
 
     def serialize(self, obj: Any, depth: int = 0) -> Any:
         """Recursively serialize obj to a JSON-compatible structure.
@@ -145,20 +251,35 @@ class _CaptureNormalizer:
             return {"__class__": obj.__class__.__name__, **serialized_attrs}
         return {"__class__": obj.__class__.__name__, "__repr__": repr(obj)}
 
+    def _mask_string(self, data: str) -> str:
+        if len(data) > MAX_STRING_LENGTH_FOR_REGEX:
+            logger.debug(
+                "SST: Skipping PII masking for string of length %s (exceeds %s)",
+                len(data),
+                MAX_STRING_LENGTH_FOR_REGEX,
+            )
+            return data
+        if self._pii_trigger_tbl is not None and len(data.translate(self._pii_trigger_tbl)) == len(data):
+            return data
+        masked = self._mask_cache.get(data)
+        if masked is not None:
+            return masked
+        original = data
+        if self._combined_pii is not None:
+            data = self._combined_pii.sub(self._pii_replacement_for, data)
+        else:
+            for label, pattern in self.pii_patterns.items():
+                data = pattern.sub(f"[MASKED_{label.upper()}]", data)
+        if len(self._mask_cache) >= 2048:
+            self._mask_cache.clear()
+        self._mask_cache[original] = data
+        return data
+
     def mask_pii(self, data: Any, depth: int = 0) -> Any:
         if depth > self.MAX_DEPTH:
             return self.TRUNCATION_SENTINEL
         if isinstance(data, str):
-            if len(data) > MAX_STRING_LENGTH_FOR_REGEX:
-                logger.debug(
-                    "SST: Skipping PII masking for string of length %s (exceeds %s)",
-                    len(data),
-                    MAX_STRING_LENGTH_FOR_REGEX,
-                )
-                return data
-            for label, pattern in self.pii_patterns.items():
-                data = pattern.sub(f"[MASKED_{label.upper()}]", data)
-            return data
+            return self._mask_string(data)
         if isinstance(data, dict):
             masked_dict = {}
             for k, v in data.items():
@@ -172,17 +293,65 @@ class _CaptureNormalizer:
             return [self.mask_pii(item, depth + 1) for item in data]
         return data
 
+    def serialize_and_mask(self, obj: Any, depth: int = 0) -> Any:
+        """Serialize and PII-mask ``obj`` in a single recursive pass.
+
+        Equivalent to ``mask_pii(serialize(obj))`` but walks the object graph
+        once, so the capture hot path avoids building an intermediate
+        serialized tree only to immediately re-walk and copy it. ``serialize``
+        and ``mask_pii`` remain available for callers that need just one half
+        of the pipeline.
+        """
+        if depth > self.MAX_DEPTH:
+            return self.TRUNCATION_SENTINEL
+        if isinstance(obj, str):
+            return self._mask_string(obj)
+        if isinstance(obj, (int, float, bool, type(None))):
+            return obj
+        if isinstance(obj, dict):
+            masked = {}
+            for k, v in obj.items():
+                key = str(k)
+                masked[key] = (
+                    "[MASKED_SENSITIVE_KEY]"
+                    if self._is_sensitive_key(key)
+                    else self.serialize_and_mask(v, depth + 1)
+                )
+            return masked
+        if isinstance(obj, (list, tuple)):
+            return [self.serialize_and_mask(i, depth + 1) for i in obj]
+        if isinstance(obj, (set, frozenset)):
+            # Set ordering is defined by the unmasked serialized form; keep the
+            # two-pass path here so element order matches the unfused pipeline.
+            return self.mask_pii(self.serialize(obj, depth), depth)
+        if hasattr(obj, "__sst_serialize__"):
+            return self.serialize_and_mask(obj.__sst_serialize__(), depth + 1)
+        if hasattr(obj, "__dict__"):
+            masked_attrs = self.serialize_and_mask(obj.__dict__, depth + 1)
+            if isinstance(masked_attrs, dict):
+                masked_attrs.pop("__class__", None)
+            return {"__class__": self._mask_string(obj.__class__.__name__), **masked_attrs}
+        return {
+            "__class__": self._mask_string(obj.__class__.__name__),
+            "__repr__": self._mask_string(repr(obj)),
+        }
+
 
 class _Fingerprint:
     MAX_DEPTH = 100
 
     @staticmethod
     def semantic_hash(data: Any) -> str:
+        # NOTE: semantic IDs are persisted in baseline filenames, so the bytes
+        # fed to sha256 are a compatibility contract — the type-tagged leaves
+        # and stdlib dumps formatting must not change. Key ordering is applied
+        # once by json.dumps(sort_keys=True); the canonicalize walk used to
+        # sort every dict a second time for no effect on the output.
         def canonicalize(obj, depth: int = 0):
             if depth > _Fingerprint.MAX_DEPTH:
                 return {"__sst_truncated__": "MAX_DEPTH_REACHED"}
             if isinstance(obj, dict):
-                return {k: canonicalize(v, depth + 1) for k, v in sorted(obj.items())}
+                return {k: canonicalize(v, depth + 1) for k, v in obj.items()}
             if isinstance(obj, list):
                 return [canonicalize(i, depth + 1) for i in obj]
             if isinstance(obj, float) and obj == 0.0:
@@ -194,11 +363,23 @@ class _Fingerprint:
 
 
 class SSTCore:
+    _TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
     def __init__(self, storage_dir=None, baseline_dir=None, env_var="SST_ENABLED"):
         self._config = get_config()
         self.storage_dir = storage_dir or os.getenv("SST_STORAGE_DIR", self._config.shadow_dir)
         self.baseline_dir = baseline_dir or os.getenv("SST_BASELINE_DIR", self._config.baseline_dir)
         self._env_var = env_var
+        self._mode_raw = None
+        self._mode = (True, False, False)
+        # Instance-local RNG: avoids contending on the global random lock in
+        # threaded servers, and seeds from os.urandom so forked workers do not
+        # share a sampling stream.
+        self._sampler = random.Random(os.urandom(8)).random
+        self._sampling_rate = max(0.0, min(1.0, float(self._config.sampling_rate)))
+        self._write_queue = None
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
         self._normalizer = _CaptureNormalizer(
             extra_pii_keys=self._config.pii_keys,
             strict_pii_matching=self._config.strict_pii_matching,
@@ -207,24 +388,57 @@ class SSTCore:
 
     @staticmethod
     def _env_truthy(name: str, default: str) -> bool:
-        return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+        return os.getenv(name, default).strip().lower() in SSTCore._TRUTHY_VALUES
+
+    def _capture_mode(self) -> tuple:
+        """Return (capture_enabled, enabled, verify_mode) for the current env.
+
+        The normalized flags are memoized against the raw env strings, so the
+        common case — SST disabled in production — costs three dict lookups
+        and a tuple compare per call instead of repeated string normalization.
+        Toggling the variables at runtime (as the demo scripts do) still takes
+        effect immediately because the raw values are re-read every call.
+        """
+        raw = (
+            os.environ.get("SST_CAPTURE_ENABLED"),
+            os.environ.get(self._env_var),
+            os.environ.get("SST_VERIFY"),
+        )
+        if raw != self._mode_raw:
+            capture_raw, enabled_raw, verify_raw = raw
+            self._mode = (
+                (capture_raw if capture_raw is not None else "true").strip().lower() in self._TRUTHY_VALUES,
+                (enabled_raw if enabled_raw is not None else "false").strip().lower() in self._TRUTHY_VALUES,
+                (verify_raw if verify_raw is not None else "false").lower() == "true",
+            )
+            self._mode_raw = raw
+        return self._mode
+
+    def refresh(self) -> None:
+        """Drop the memoized capture-mode snapshot.
+
+        Not normally needed — the snapshot re-validates against the raw env
+        strings on every call — but gives embedders an explicit invalidation
+        point if they bypass os.environ (e.g. patching os.environ itself)."""
+        self._mode_raw = None
 
     def _should_sample_capture(self, sampling_rate: float | None = None) -> bool:
-        rate = self._config.sampling_rate if sampling_rate is None else sampling_rate
-        clamped_rate = max(0.0, min(1.0, float(rate)))
-        return random.random() < clamped_rate
+        rate = self._sampling_rate if sampling_rate is None else max(0.0, min(1.0, float(sampling_rate)))
+        # rate >= 1.0 short-circuits the RNG entirely — the default
+        # sample-everything configuration never draws a number.
+        return rate >= 1.0 or self._sampler() < rate
 
     @property
     def enabled(self):
-        return self._env_truthy(self._env_var, "false")
+        return self._capture_mode()[1]
 
     @property
     def capture_enabled(self):
-        return self._env_truthy("SST_CAPTURE_ENABLED", "true")
+        return self._capture_mode()[0]
 
     @property
     def verify_mode(self):
-        return os.getenv("SST_VERIFY", "false").lower() == "true"
+        return self._capture_mode()[2]
 
     def _serialize(self, obj: Any) -> Any:
         return self._normalizer.serialize(obj)
@@ -232,8 +446,11 @@ class SSTCore:
     def _mask_pii(self, data: Any) -> Any:
         return self._normalizer.mask_pii(data)
 
-    def _build_structured_diff(self, baseline: Any, current: Any, path: str = "$"):
-        return build_structured_diff(baseline, current, path)
+    def _serialize_masked(self, obj: Any) -> Any:
+        return self._normalizer.serialize_and_mask(obj)
+
+    def _build_structured_diff(self, baseline: Any, current: Any, path: str = "$", limit: int | None = None):
+        return build_structured_diff(baseline, current, path, limit=limit)
 
     def _get_semantic_hash(self, data: Any) -> str:
         """Backward-compatible semantic fingerprint helper."""
@@ -242,8 +459,9 @@ class SSTCore:
     def _explain_regression(self, changes):
         return summarize_changes(changes)
 
-    def _verify_against_baseline(self, func, masked_inputs, masked_result):
-        semantic_id = _Fingerprint.semantic_hash(masked_inputs)
+    def _verify_against_baseline(self, func, masked_inputs, masked_result, semantic_id=None):
+        if semantic_id is None:
+            semantic_id = _Fingerprint.semantic_hash(masked_inputs)
         baseline_path = os.path.join(self.baseline_dir, f"{func.__module__}.{func.__name__}_{semantic_id}.json")
         if not os.path.exists(baseline_path):
             return
@@ -253,16 +471,25 @@ class SSTCore:
             return
         baseline_output = baseline_record["scenario"].get("output", {}).get("raw_result")
 
-        filtered_result = normalize_for_compare(apply_diff_policy(masked_result))
-        filtered_baseline = normalize_for_compare(apply_diff_policy(baseline_output))
+        filtered_result = normalize_and_filter(masked_result)
+        filtered_baseline = normalize_and_filter(baseline_output)
 
         if filtered_result != filtered_baseline:
-            structured_diff = self._build_structured_diff(filtered_baseline, filtered_result)
+            # Cap the report: a hugely divergent payload should not balloon
+            # the exception message with every single change.
+            structured_diff = self._build_structured_diff(
+                filtered_baseline, filtered_result, limit=_MAX_REPORTED_CHANGES + 1
+            )
+            truncated = len(structured_diff) > _MAX_REPORTED_CHANGES
+            if truncated:
+                structured_diff = structured_diff[:_MAX_REPORTED_CHANGES]
             error_msg = f"\nREGRESSION DETECTED in {func.__module__}.{func.__name__}\n"
             error_msg += f"Semantic ID: {semantic_id}\n"
             error_msg += "Summary:\n" + self._explain_regression(structured_diff) + "\n\n"
             error_msg += "Human-readable diff:\n" + format_human_diff(structured_diff) + "\n\n"
             error_msg += "Structured diff:\n" + json.dumps(structured_diff, indent=2, sort_keys=True)
+            if truncated:
+                error_msg += f"\n(diff truncated at {_MAX_REPORTED_CHANGES} changes)"
             error_msg += f"\nTo approve this change, run: sst approve {func.__module__}.{func.__name__} {semantic_id}"
             scenario_id = f"{func.__module__}.{func.__name__}:{semantic_id}"
             raise RegressionDetectedError(message=error_msg, scenario_id=scenario_id)
@@ -273,11 +500,11 @@ class SSTCore:
         except Exception:
             return []
 
-    def _capture_metadata(self) -> Dict[str, str]:
+    def _capture_metadata(self, timestamp: str | None = None) -> Dict[str, str]:
         return {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "python_version": platform.python_version(),
-            "hostname": socket.gethostname(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "python_version": _PYTHON_VERSION,
+            "hostname": _HOSTNAME,
         }
 
     def _capture_dependency_hooks(self) -> Dict[str, Any]:
@@ -286,40 +513,98 @@ class SSTCore:
             "database_calls": {"captured": False, "hook": "stub"},
         }
 
-    def _build_payload(self, func, masked_inputs, output_snapshot: CaptureOutput) -> CapturePayload:
-        semantic_id = _Fingerprint.semantic_hash(masked_inputs)
+    def _build_payload(
+        self,
+        func,
+        masked_inputs,
+        output_snapshot: CaptureOutput,
+        captured_at: datetime | None = None,
+        semantic_id: str | None = None,
+    ) -> CapturePayload:
+        if semantic_id is None:
+            semantic_id = _Fingerprint.semantic_hash(masked_inputs)
         if output_snapshot.get("status") == "success" and "raw_result" not in output_snapshot:
             raise CaptureContractError("Successful capture output is missing required field: raw_result")
+        timestamp = (captured_at or datetime.now(timezone.utc)).isoformat()
         return CapturePayload(
             function=func.__name__,
             module=func.__module__,
             semantic_id=semantic_id,
             engine_version=__version__,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=timestamp,
             input=masked_inputs,
             output=output_snapshot,
             dependencies=self._analyze_dependencies(func),
-            execution_metadata=self._capture_metadata(),
+            execution_metadata=self._capture_metadata(timestamp),
             dependency_capture=self._capture_dependency_hooks(),
             source=_cached_get_source(func),
         )
 
-    def _write_capture(self, func, masked_inputs, output_snapshot):
+    def _ensure_writer(self):
+        if self._writer_thread is None:
+            with self._writer_lock:
+                if self._writer_thread is None:
+                    self._write_queue = queue.Queue()
+                    thread = threading.Thread(target=self._drain_writes, name="sst-capture-writer", daemon=True)
+                    thread.start()
+                    self._writer_thread = thread
+                    atexit.register(self.flush_writes)
+        return self._write_queue
+
+    def _drain_writes(self):
+        while True:
+            path, payload_bytes = self._write_queue.get()
+            try:
+                self._write_file(path, payload_bytes)
+            finally:
+                self._write_queue.task_done()
+
+    def flush_writes(self) -> None:
+        """Block until all queued capture writes have reached disk."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+
+    def _write_file(self, path, payload_bytes):
+        try:
+            try:
+                with open(path, "wb") as f:
+                    f.write(payload_bytes)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(payload_bytes)
+        except Exception as write_err:
+            logger.warning("SST: Failed to write capture data: %s", write_err)
+
+    def _write_capture(self, func, masked_inputs, output_snapshot, semantic_id=None):
         if self.verify_mode:
             # In verify mode the CLI pipeline manages capture storage.
             # Writing here would accumulate stale files in shadow_dir.
             return
         try:
-            os.makedirs(self.storage_dir, exist_ok=True)
-            capture_payload = self._build_payload(func, masked_inputs, output_snapshot)
+            # One clock read per capture, shared by the payload timestamp,
+            # the execution metadata and the filename suffix.
+            captured_at = datetime.now(timezone.utc)
+            capture_payload = self._build_payload(func, masked_inputs, output_snapshot, captured_at, semantic_id)
             filename = (
                 f"{capture_payload.module}.{capture_payload.function}_{capture_payload.semantic_id}_"
-                f"{datetime.now(timezone.utc).strftime('%H%M%S_%f')}.json"
+                f"{captured_at.strftime('%H%M%S_%f')}.json"
             )
-            with open(os.path.join(self.storage_dir, filename), "w", encoding="utf-8") as f:
-                json.dump(asdict(capture_payload), f, indent=2, sort_keys=True, allow_nan=False)
+            # Shallow field dict instead of asdict(): the payload values are
+            # already plain JSON structures, so the deep copy bought nothing.
+            record = {f.name: getattr(capture_payload, f.name) for f in fields(capture_payload)}
+            payload_bytes = _fastjson.dumps_bytes(record, sort_keys=True, indent_2=True)
         except Exception as write_err:
             logger.warning("SST: Failed to write capture data: %s", write_err)
+            return
+        path = os.path.join(self.storage_dir, filename)
+        # Default is synchronous so callers (and the CLI record flow) can read
+        # their own writes immediately; latency-sensitive services can opt in
+        # to a background writer that takes disk I/O off the request path.
+        if self._env_truthy("SST_ASYNC_CAPTURE_WRITES", "false"):
+            self._ensure_writer().put((path, payload_bytes))
+        else:
+            self._write_file(path, payload_bytes)
 
     def capture(self, func=None, *, sampling_rate: float | None = None):
         """Decorator that captures function inputs and outputs for SST.
@@ -349,55 +634,55 @@ class SSTCore:
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                if not self.capture_enabled:
-                    return await func(*args, **kwargs)
-                if not self.enabled and not self.verify_mode:
+                capture_enabled, enabled, verify_mode = self._capture_mode()
+                if not capture_enabled or (not enabled and not verify_mode):
                     return await func(*args, **kwargs)
-                if self.enabled and not self.verify_mode and not self._should_sample_capture(sampling_rate):
+                if enabled and not verify_mode and not self._should_sample_capture(sampling_rate):
                     return await func(*args, **kwargs)
 
-                masked_inputs = self._mask_pii(self._serialize({"args": list(args), "kwargs": kwargs}))
+                masked_inputs = self._serialize_masked({"args": list(args), "kwargs": kwargs})
+                semantic_id = _Fingerprint.semantic_hash(masked_inputs)
                 output_snapshot: CaptureOutput = {"status": "unknown"}
                 masked_result = None
                 try:
                     result = await func(*args, **kwargs)
-                    masked_result = self._mask_pii(self._serialize(result))
+                    masked_result = self._serialize_masked(result)
                     output_snapshot = {"raw_result": masked_result, "status": "success"}
                     return result
                 except Exception as exc:
                     output_snapshot = {"error": str(exc), "error_type": type(exc).__name__, "status": "failure"}
                     raise
                 finally:
-                    self._write_capture(func, masked_inputs, output_snapshot)
+                    self._write_capture(func, masked_inputs, output_snapshot, semantic_id)
                     if self.verify_mode and output_snapshot.get("status") == "success":
-                        self._verify_against_baseline(func, masked_inputs, masked_result)
+                        self._verify_against_baseline(func, masked_inputs, masked_result, semantic_id)
 
             return async_wrapper
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if not self.capture_enabled:
-                return func(*args, **kwargs)
-            if not self.enabled and not self.verify_mode:
+            capture_enabled, enabled, verify_mode = self._capture_mode()
+            if not capture_enabled or (not enabled and not verify_mode):
                 return func(*args, **kwargs)
-            if self.enabled and not self.verify_mode and not self._should_sample_capture(sampling_rate):
+            if enabled and not verify_mode and not self._should_sample_capture(sampling_rate):
                 return func(*args, **kwargs)
 
-            masked_inputs = self._mask_pii(self._serialize({"args": list(args), "kwargs": kwargs}))
+            masked_inputs = self._serialize_masked({"args": list(args), "kwargs": kwargs})
+            semantic_id = _Fingerprint.semantic_hash(masked_inputs)
             output_snapshot: CaptureOutput = {"status": "unknown"}
             masked_result = None
             try:
                 result = func(*args, **kwargs)
-                masked_result = self._mask_pii(self._serialize(result))
+                masked_result = self._serialize_masked(result)
                 output_snapshot = {"raw_result": masked_result, "status": "success"}
                 return result
             except Exception as exc:
                 output_snapshot = {"error": str(exc), "error_type": type(exc).__name__, "status": "failure"}
                 raise
             finally:
-                self._write_capture(func, masked_inputs, output_snapshot)
+                self._write_capture(func, masked_inputs, output_snapshot, semantic_id)
                 if self.verify_mode and output_snapshot.get("status") == "success":
-                    self._verify_against_baseline(func, masked_inputs, masked_result)
+                    self._verify_against_baseline(func, masked_inputs, masked_result, semantic_id)
 
         return wrapper
 
@@ -11,6 +11,7 @@ Dynamic field suppression is policy driven and explicit via ``DiffPolicy``.
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import math
@@ -19,15 +20,77 @@ import sys
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Set
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Set
 
-from .config import get_config
+from .config import Config, get_config
 from .errors import DiffContractError
 from .types import DiffChange
 
 MAX_DIFF_DEPTH = 1000
 MAX_DEPTH = 100
 
+
+@dataclass(frozen=True)
+class _ResolvedDiffPolicy:
+    """Pre-normalized view of a Config's diff_policy for the diff hot paths.
+
+    ``apply_diff_policy`` and ``normalize_for_compare`` used to re-read the
+    config and rebuild path sets, tolerance and flags on every call — and
+    ``normalize_for_compare`` recurses through its own public entry point, so
+    deep payloads paid that rebuild per node. Resolving once per Config
+    instance makes the inner walks read cached frozensets.
+    """
+
+    ignored_paths_matchset: frozenset
+    list_sort_matchset: frozenset
+    float_tolerance: float
+    decimals: int
+    mask_timestamps: bool
+    mask_uuid_like: bool
+    normalize_string_whitespace: bool
+
+
+def _expand_path_matchset(paths) -> frozenset:
+    """Expand path spellings ("p", "$.p", "$p") into one exact-match set."""
+    matchset = set()
+    for raw in paths:
+        path = str(raw).strip()
+        if path:
+            matchset.update((path, f"$.{path}", f"${path}"))
+    return frozenset(matchset)
+
+
+# Keyed by id(config); the stored Config reference keeps the id from being
+# reused, so an identity hit is always the same object the entry was built for.
+_RESOLVED_POLICIES: Dict[int, tuple] = {}
+
+
+def _resolved_policy(cfg: Config) -> _ResolvedDiffPolicy:
+    entry = _RESOLVED_POLICIES.get(id(cfg))
+    if entry is not None and entry[0] is cfg:
+        return entry[1]
+
+    cfg_policy = cfg.diff_policy
+    ignored_matchset = cfg_policy.get("_ignored_paths_matchset")
+    if ignored_matchset is None:
+        ignored_matchset = _expand_path_matchset(cfg_policy.get("ignored_paths", []))
+    float_tolerance = float(cfg_policy.get("float_tolerance", 1e-6))
+    decimals = 6 if float_tolerance <= 0 else max(0, min(12, abs(int(round(-math.log10(float_tolerance))))))
+    resolved = _ResolvedDiffPolicy(
+        ignored_paths_matchset=frozenset(ignored_matchset),
+        list_sort_matchset=_expand_path_matchset(cfg_policy.get("list_sort_paths", [])),
+        float_tolerance=float_tolerance,
+        decimals=decimals,
+        mask_timestamps=bool(cfg_policy.get("mask_timestamps", True)),
+        mask_uuid_like=bool(cfg_policy.get("mask_uuid_like", False)),
+        normalize_string_whitespace=bool(cfg_policy.get("normalize_string_whitespace", True)),
+    )
+    if len(_RESOLVED_POLICIES) >= 32:
+        _RESOLVED_POLICIES.clear()
+    _RESOLVED_POLICIES[id(cfg)] = (cfg, resolved)
+    return resolved
+
 _ISO_TS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})$")
 _UUID_RE = re.compile(
     r"^[0-9a-fA-F]{8}-"
@@ -36,6 +99,15 @@ _UUID_RE = re.compile(
     r"[89abAB][0-9a-fA-F]{3}-"
     r"[0-9a-fA-F]{12}$"
 )
+_TRAILING_INDEX_RE = re.compile(r"\[\d+\]$")
+_WS_RUN_RE = re.compile(r"\s+")
+
+# Bound methods save a Pattern attribute lookup per string on the hot paths.
+_iso_ts_match = _ISO_TS_RE.match
+_uuid_match = _UUID_RE.match
+_trailing_index_sub = _TRAILING_INDEX_RE.sub
+_ws_run_search = _WS_RUN_RE.search
+_ws_run_sub = _WS_RUN_RE.sub
 
 
 @dataclass(frozen=True)
@@ -61,18 +133,41 @@ def current_diff_policy(policy: DiffPolicy = DEFAULT_DIFF_POLICY) -> DiffPolicy:
     """Resolve runtime effective diff policy, including configured ignored fields."""
     cfg_policy = get_config().diff_policy
     if policy is DEFAULT_DIFF_POLICY:
+        ignored_fields = cfg_policy.get("_ignored_fields_set")
+        if ignored_fields is None:
+            ignored_fields = {field.lower() for field in cfg_policy.get("ignored_fields", DEFAULT_DIFF_POLICY.ignored_fields)}
         return DiffPolicy(
             policy_id="configured-v1",
             semantics_version=1,
-            ignored_fields={field.lower() for field in cfg_policy.get("ignored_fields", DEFAULT_DIFF_POLICY.ignored_fields)},
+            ignored_fields=ignored_fields,
         )
     return policy
 
 
+# Deterministic per (Config, policy) pair; caching skips the sort, canonical
+# dumps and sha256 that every baseline save re-paid. Identity-keyed like
+# _RESOLVED_POLICIES below; deep-copied on the way out because callers embed
+# the snapshot in mutable metadata.
+_SNAPSHOT_CACHE: Dict[tuple, tuple] = {}
+
+
 def diff_policy_snapshot(policy: DiffPolicy | None = None) -> Dict[str, Any]:
     """Serializable snapshot for baseline metadata to detect policy drift."""
+    cfg = get_config()
+    cache_key = (id(cfg), id(policy))
+    entry = _SNAPSHOT_CACHE.get(cache_key)
+    if entry is not None and entry[0] is cfg and entry[1] is policy:
+        return copy.deepcopy(entry[2])
+    payload = _build_diff_policy_snapshot(policy, cfg)
+    if len(_SNAPSHOT_CACHE) >= 16:
+        _SNAPSHOT_CACHE.clear()
+    _SNAPSHOT_CACHE[cache_key] = (cfg, policy, payload)
+    return copy.deepcopy(payload)
+
+
+def _build_diff_policy_snapshot(policy: DiffPolicy | None, cfg: Config) -> Dict[str, Any]:
     effective = current_diff_policy(policy or DEFAULT_DIFF_POLICY)
-    cfg_policy = get_config().diff_policy
+    cfg_policy = cfg.diff_policy
     config = {
         "ignored_fields": sorted(effective.ignored_fields),
         "ignored_paths": [str(path).strip() for path in cfg_policy.get("ignored_paths", []) if str(path).strip()],
@@ -99,28 +194,18 @@ def apply_diff_policy(data: Any, policy: DiffPolicy = DEFAULT_DIFF_POLICY, depth
     if data is None:
         return None
 
-    cfg_policy = get_config().diff_policy
-    ignored_paths = {str(path).strip() for path in cfg_policy.get("ignored_paths", []) if str(path).strip()}
-
-    def _matches_ignored_path(path: str) -> bool:
-        if path in ignored_paths:
-            return True
-        if path.startswith("$.") and path[2:] in ignored_paths:
-            return True
-        if path.startswith("$") and path[1:] in ignored_paths:
-            return True
-        return False
+    matchset = _resolved_policy(get_config()).ignored_paths_matchset
 
     def _apply(value: Any, path: str, current_depth: int) -> Any:
         if current_depth > MAX_DEPTH:
             return "[MAX_DEPTH_REACHED]"
-        if _matches_ignored_path(path):
+        if path in matchset:
             return None
         if isinstance(value, dict):
             result = {}
             for key, child in value.items():
                 key_path = f"{path}.{key}"
-                if key.lower() in policy.ignored_fields or _matches_ignored_path(key_path):
+                if key.lower() in policy.ignored_fields or key_path in matchset:
                     continue
                 result[key] = _apply(child, key_path, current_depth + 1)
             return result
@@ -128,7 +213,7 @@ def apply_diff_policy(data: Any, policy: DiffPolicy = DEFAULT_DIFF_POLICY, depth
             result_list = []
             for index, item in enumerate(value):
                 item_path = f"{path}[{index}]"
-                if _matches_ignored_path(item_path):
+                if item_path in matchset:
                     continue
                 result_list.append(_apply(item, item_path, current_depth + 1))
             return result_list
@@ -137,7 +222,7 @@ def apply_diff_policy(data: Any, policy: DiffPolicy = DEFAULT_DIFF_POLICY, depth
     policy = current_diff_policy(policy)
     if not isinstance(policy.semantics_version, int):
         raise DiffContractError("Diff policy semantics_version must be an integer")
-    if _matches_ignored_path("$"):
+    if "$" in matchset:
         return None
     return _apply(data, "$", depth)
 
@@ -147,57 +232,129 @@ def filter_dynamic_fields(data: Any) -> Any:
     return apply_diff_policy(data, DEFAULT_DIFF_POLICY)
 
 
+def _canonical_sort_key(value: Any) -> str:
+    try:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    except Exception:
+        return repr(value)
+
+
+def _canonical_tuple(value: Any) -> tuple:
+    """Hashable nested-tuple key for sorting normalized list elements.
+
+    Tuples compare in C without serializing every element to JSON first.
+    The leading tag keeps containers and scalars in disjoint groups, and the
+    type name keeps cross-type scalar comparisons (bool vs int, int vs str)
+    from ever comparing raw values of different types.
+    """
+    if isinstance(value, dict):
+        return (0, tuple((key, _canonical_tuple(child)) for key, child in sorted(value.items())))
+    if isinstance(value, (list, tuple)):
+        return (1, tuple(_canonical_tuple(item) for item in value))
+    return (2, type(value).__name__, value)
+
+
+def _sort_normalized_list(items: list) -> list:
+    try:
+        return sorted(items, key=_canonical_tuple)
+    except TypeError:
+        # Uncomparable leaves (custom objects without __lt__, mixed dict key
+        # types) fall back to the JSON-string key.
+        return sorted(items, key=_canonical_sort_key)
+
+
 def normalize_for_compare(data: Any, path: str = "$", depth: int = 0) -> Any:
     """Normalize payloads into deterministic structures for stable comparison."""
+    return _normalize(data, path, depth, _resolved_policy(get_config()))
+
+
+def _normalize(data: Any, path: str, depth: int, resolved: _ResolvedDiffPolicy) -> Any:
     if depth > MAX_DEPTH:
         return "[MAX_DEPTH_REACHED]"
 
-    cfg_policy = get_config().diff_policy
-    float_tolerance = float(cfg_policy.get("float_tolerance", 1e-6))
-    decimals = 6 if float_tolerance <= 0 else max(0, min(12, abs(int(round(-math.log10(float_tolerance))))))
-    mask_timestamps = bool(cfg_policy.get("mask_timestamps", True))
-    mask_uuid_like = bool(cfg_policy.get("mask_uuid_like", False))
-    normalize_string_whitespace = bool(cfg_policy.get("normalize_string_whitespace", True))
-    list_sort_paths = {str(item).strip() for item in cfg_policy.get("list_sort_paths", []) if str(item).strip()}
-
-    def _should_sort_list(current_path: str) -> bool:
-        if current_path in list_sort_paths:
-            return True
-        if current_path.startswith("$.") and current_path[2:] in list_sort_paths:
-            return True
-        if current_path.startswith("$") and current_path[1:] in list_sort_paths:
-            return True
-        return False
-
-    def _canonical_sort_key(value: Any) -> str:
-        try:
-            return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
-        except Exception:
-            return repr(value)
-
     if isinstance(data, dict):
-        return {key: normalize_for_compare(data[key], f"{path}.{key}", depth + 1) for key in sorted(data.keys())}
+        return {key: _normalize(data[key], f"{path}.{key}", depth + 1, resolved) for key in sorted(data.keys())}
     if isinstance(data, list):
         normalized_list = [
-            normalize_for_compare(item, f"{path}[{index}]", depth + 1) for index, item in enumerate(data)
+            _normalize(item, f"{path}[{index}]", depth + 1, resolved) for index, item in enumerate(data)
         ]
-        if _should_sort_list(path):
-            return sorted(normalized_list, key=_canonical_sort_key)
+        if path in resolved.list_sort_matchset:
+            return _sort_normalized_list(normalized_list)
         return normalized_list
     if isinstance(data, float):
-        if float_tolerance == 0:
+        if resolved.float_tolerance == 0:
             return data
-        return round(data, decimals)
+        return round(data, resolved.decimals)
     if isinstance(data, str):
-        if normalize_string_whitespace:
-            data = " ".join(data.split())
-        if mask_timestamps and _ISO_TS_RE.match(data):
+        if resolved.normalize_string_whitespace and _ws_run_search(data) is not None:
+            # One regex substitution instead of split-list + join; strings
+            # without any whitespace (the common leaf) allocate nothing.
+            data = _ws_run_sub(" ", data).strip()
+        if resolved.mask_timestamps and _iso_ts_match(data):
             try:
                 datetime.fromisoformat(data.replace("Z", "+00:00"))
                 return "<timestamp>"
             except ValueError:
                 return data
-        if mask_uuid_like and _UUID_RE.match(data):
+        if resolved.mask_uuid_like and _uuid_match(data):
+            return "<uuid>"
+    return data
+
+
+def normalize_and_filter(data: Any, policy: DiffPolicy | None = None) -> Any:
+    """Apply the diff policy and normalize in one walk.
+
+    Equivalent to ``normalize_for_compare(apply_diff_policy(data, policy))``
+    but traverses the tree once instead of filtering into an intermediate
+    copy and re-walking it. Used on the verify hot path, where both the
+    baseline and the current result pay this per captured call.
+    """
+    resolved = _resolved_policy(get_config())
+    effective = current_diff_policy(policy or DEFAULT_DIFF_POLICY)
+    if not isinstance(effective.semantics_version, int):
+        raise DiffContractError("Diff policy semantics_version must be an integer")
+    if "$" in resolved.ignored_paths_matchset:
+        return None
+    return _filter_normalize(data, "$", 0, resolved, effective.ignored_fields)
+
+
+def _filter_normalize(data: Any, path: str, depth: int, resolved: _ResolvedDiffPolicy, ignored_fields) -> Any:
+    if depth > MAX_DEPTH:
+        return "[MAX_DEPTH_REACHED]"
+
+    matchset = resolved.ignored_paths_matchset
+    if isinstance(data, dict):
+        result = {}
+        for key in sorted(data.keys()):
+            key_path = f"{path}.{key}"
+            if key.lower() in ignored_fields or key_path in matchset:
+                continue
+            result[key] = _filter_normalize(data[key], key_path, depth + 1, resolved, ignored_fields)
+        return result
+    if isinstance(data, list):
+        filtered = []
+        for index, item in enumerate(data):
+            item_path = f"{path}[{index}]"
+            if item_path in matchset:
+                continue
+            filtered.append(_filter_normalize(item, item_path, depth + 1, resolved, ignored_fields))
+        if path in resolved.list_sort_matchset:
+            return _sort_normalized_list(filtered)
+        return filtered
+    if isinstance(data, float):
+        if resolved.float_tolerance == 0:
+            return data
+        return round(data, resolved.decimals)
+    if isinstance(data, str):
+        if resolved.normalize_string_whitespace and _ws_run_search(data) is not None:
+            data = _ws_run_sub(" ", data).strip()
+        if resolved.mask_timestamps and _iso_ts_match(data):
+            try:
+                datetime.fromisoformat(data.replace("Z", "+00:00"))
+                return "<timestamp>"
+            except ValueError:
+                return data
+        if resolved.mask_uuid_like and _uuid_match(data):
             return "<uuid>"
     return data
 
@@ -213,87 +370,123 @@ def _severity(change_type: str) -> str:
     return mapping.get(change_type, "low")
 
 
-def build_structured_diff(baseline: Any, current: Any, path: str = "$", depth: int = 0) -> List[DiffChange]:
-    """Build a path-aware deep diff for dict/list/primitive JSON-like objects."""
-    max_depth = min(MAX_DIFF_DEPTH, max(1, sys.getrecursionlimit() - 100))
-    if depth > max_depth:
-        raise ValueError("Maximum diff depth exceeded")
-
-    changes: List[DiffChange] = []
-
-    if type(baseline) is not type(current):
-        changes.append(
-            {
-                "path": path,
-                "change_type": "type_changed",
-                "severity": _severity("type_changed"),
-                "baseline": baseline,
-                "current": current,
-                "baseline_type": type(baseline).__name__,
-                "current_type": type(current).__name__,
-            }
-        )
-        return changes
+def iter_structured_diff(baseline: Any, current: Any, path: str = "$", depth: int = 0) -> Iterator[DiffChange]:
+    """Yield path-aware deep-diff changes for dict/list/primitive objects.
 
-    if isinstance(baseline, dict):
-        baseline_keys = set(baseline.keys())
-        current_keys = set(current.keys())
+    Implemented with an explicit work stack rather than recursion: deep
+    payloads avoid a Python frame per node, and key comparison uses dict-view
+    set operations instead of materializing full ``set`` copies. Yielding
+    incrementally keeps peak memory at O(depth) rather than O(changes) and
+    lets callers stop after the first N changes. Emission order matches the
+    recursive formulation — pre-order, dict keys sorted, list length changes
+    after the indexed element diffs.
+    """
+    max_depth = min(MAX_DIFF_DEPTH, max(1, sys.getrecursionlimit() - 100))
 
-        for key in sorted(baseline_keys - current_keys):
-            changes.append(
+    # Severities are fixed per change type and the push/pop callables are
+    # bound to locals: both save a global/attribute lookup per node, which is
+    # the bulk of what the interpreter spends on this loop for large trees.
+    severity_type_changed = _severity("type_changed")
+    severity_removed = _severity("removed")
+    severity_added = _severity("added")
+    severity_length = _severity("length_changed")
+    severity_value = _severity("value_changed")
+
+    # Work items: ("node", baseline, current, path, depth) comparisons, plus
+    # ("length", path, len_b, len_c) markers pushed below a list's children so
+    # the length change is emitted after the element diffs, as before.
+    stack: list = [("node", baseline, current, path, depth)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        item = pop()
+        if item[0] == "length":
+            _, node_path, baseline_len, current_len = item
+            yield (
                 {
-                    "path": f"{path}.{key}",
-                    "change_type": "removed",
-                    "severity": _severity("removed"),
-                    "baseline": baseline[key],
-                    "current": None,
+                    "path": node_path,
+                    "change_type": "length_changed",
+                    "severity": severity_length,
+                    "baseline": baseline_len,
+                    "current": current_len,
                 }
             )
+            continue
 
-        for key in sorted(current_keys - baseline_keys):
-            changes.append(
+        _, node_baseline, node_current, node_path, node_depth = item
+        if node_depth > max_depth:
+            raise ValueError("Maximum diff depth exceeded")
+
+        if type(node_baseline) is not type(node_current):
+            yield (
                 {
-                    "path": f"{path}.{key}",
-                    "change_type": "added",
-                    "severity": _severity("added"),
-                    "baseline": None,
-                    "current": current[key],
+                    "path": node_path,
+                    "change_type": "type_changed",
+                    "severity": severity_type_changed,
+                    "baseline": node_baseline,
+                    "current": node_current,
+                    "baseline_type": type(node_baseline).__name__,
+                    "current_type": type(node_current).__name__,
                 }
             )
+            continue
+
+        if isinstance(node_baseline, dict):
+            baseline_keys = node_baseline.keys()
+            current_keys = node_current.keys()
+
+            for key in sorted(baseline_keys - current_keys):
+                yield (
+                    {
+                        "path": f"{node_path}.{key}",
+                        "change_type": "removed",
+                        "severity": severity_removed,
+                        "baseline": node_baseline[key],
+                        "current": None,
+                    }
+                )
 
-        for key in sorted(baseline_keys & current_keys):
-            changes.extend(build_structured_diff(baseline[key], current[key], f"{path}.{key}", depth + 1))
+            for key in sorted(current_keys - baseline_keys):
+                yield (
+                    {
+                        "path": f"{node_path}.{key}",
+                        "change_type": "added",
+                        "severity": severity_added,
+                        "baseline": None,
+                        "current": node_current[key],
+                    }
+                )
 
-        return changes
+            for key in sorted(baseline_keys & current_keys, reverse=True):
+                push(("node", node_baseline[key], node_current[key], f"{node_path}.{key}", node_depth + 1))
+            continue
 
-    if isinstance(baseline, list):
-        for index in range(min(len(baseline), len(current))):
-            changes.extend(build_structured_diff(baseline[index], current[index], f"{path}[{index}]", depth + 1))
+        if isinstance(node_baseline, list):
+            if len(node_baseline) != len(node_current):
+                push(("length", node_path, len(node_baseline), len(node_current)))
+            for index in range(min(len(node_baseline), len(node_current)) - 1, -1, -1):
+                push(("node", node_baseline[index], node_current[index], f"{node_path}[{index}]", node_depth + 1))
+            continue
 
-        if len(baseline) != len(current):
-            changes.append(
+        if node_baseline != node_current:
+            yield (
                 {
-                    "path": path,
-                    "change_type": "length_changed",
-                    "severity": _severity("length_changed"),
-                    "baseline": len(baseline),
-                    "current": len(current),
+                    "path": node_path,
+                    "change_type": "value_changed",
+                    "severity": severity_value,
+                    "baseline": node_baseline,
+                    "current": node_current,
                 }
             )
-        return changes
-
-    if baseline != current:
-        changes.append(
-            {
-                "path": path,
-                "change_type": "value_changed",
-                "severity": _severity("value_changed"),
-                "baseline": baseline,
-                "current": current,
-            }
-        )
 
-    return changes
+def build_structured_diff(
+    baseline: Any, current: Any, path: str = "$", depth: int = 0, limit: int | None = None
+) -> List[DiffChange]:
+    """Materialize the structured diff; ``limit`` caps the collected changes."""
+    iterator = iter_structured_diff(baseline, current, path, depth)
+    if limit is None:
+        return list(iterator)
+    return list(islice(iterator, limit))
 
 
 def summarize_changes(changes: List[DiffChange]) -> str:
@@ -352,7 +545,7 @@ def format_human_diff(changes: List[DiffChange]) -> str:
                 # Extract common path prefix (e.g. "$.types" from "$.types[0]", "$.types[1]")
                 paths = [c["path"] for c in value_changed]
                 # strip trailing [N] to get parent path
-                parent_paths = list(dict.fromkeys(re.sub(r"\[\d+\]$", "", p) for p in paths))
+                parent_paths = list(dict.fromkeys(_trailing_index_sub("", p) for p in paths))
                 sort_hint = ", ".join(f'"{p}"' for p in parent_paths)
                 lines.append(
                     f"\nHint: values are identical but order differs — this may be non-deterministic ordering.\n"
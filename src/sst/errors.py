@@ -65,7 +65,15 @@ class RegressionDetectedError(RuntimeError, SSTError):
     reason_code: str = "SEMANTIC_REGRESSION"
 
     def __post_init__(self) -> None:
-        SSTError.__init__(self, self.reason_code, "DIFF", self.message, True)
+        # Set the SSTError taxonomy fields directly instead of chaining
+        # SSTError.__init__: that path formats a "[DIFF:...]" banner and
+        # seeds args with it, only for the RuntimeError init to replace
+        # args with the plain message anyway — one wasted format plus an
+        # extra init per raise on high-regression verify runs.
+        self.error_code = self.reason_code
+        self.category = "DIFF"
+        self.explanation = self.message
+        self.actionable = True
         RuntimeError.__init__(self, self.message)
 
     def __str__(self) -> str:
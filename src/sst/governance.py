@@ -5,21 +5,24 @@ Governance is policy-driven data. Policies are serializable and deterministic.
 
 from __future__ import annotations
 
-import glob
+import copy
 import hashlib
 import json
 import os
 import re
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import repeat
 from typing import Any, Dict, List, Tuple
 
-from . import __version__
+from . import __version__, _fastjson
 from .config import get_config
 from .diff import diff_policy_snapshot
 from .errors import BaselineFormatError, GovernancePolicyError, ScenarioNotFoundError
-from .sst_schema import validate_scenario_schema
+from .schema import check_scenario_schema
 from .types import BaselineRecord, GovernanceDecision, validate_baseline_record
 
 BASELINE_FORMAT_VERSION = 1
@@ -36,6 +39,12 @@ class GovernancePolicy:
     policy_id: str
     transitions: Dict[Tuple[str, str], Tuple[bool, str, str]]
 
+    def __post_init__(self):
+        # Transitions never change after construction, so the deterministic
+        # ordering snapshots iterate is computed once here instead of being
+        # re-sorted at each use site.
+        object.__setattr__(self, "_sorted_transitions", tuple(sorted(self.transitions.items())))
+
 
 DEFAULT_GOVERNANCE_POLICY = GovernancePolicy(
     policy_id="default-governance-v1",
@@ -50,23 +59,37 @@ DEFAULT_GOVERNANCE_POLICY = GovernancePolicy(
 )
 
 
+# Snapshots are deterministic per policy object (policies are frozen module
+# constants), so the sort + canonical dumps + sha256 runs once per policy.
+# Keyed by id(); the stored reference keeps the id from being reused.
+_SNAPSHOT_CACHE: Dict[int, Tuple[GovernancePolicy, Dict[str, Any]]] = {}
+
+
 def governance_policy_snapshot(policy: GovernancePolicy | None = None) -> Dict[str, Any]:
     """Serializable governance policy snapshot for baseline metadata."""
     effective = policy or resolve_governance_policy()
-    transitions = [
-        {
-            "action": action,
-            "from": current,
-            "allowed": details[0],
-            "reason_code": details[1],
-            "explanation": details[2],
-        }
-        for (action, current), details in sorted(effective.transitions.items())
-    ]
-    payload = {"policy_id": effective.policy_id, "transitions": transitions}
-    payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    payload["hash"] = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
-    return payload
+    entry = _SNAPSHOT_CACHE.get(id(effective))
+    if entry is None or entry[0] is not effective:
+        transitions = [
+            {
+                "action": action,
+                "from": current,
+                "allowed": details[0],
+                "reason_code": details[1],
+                "explanation": details[2],
+            }
+            for (action, current), details in effective._sorted_transitions
+        ]
+        payload = {"policy_id": effective.policy_id, "transitions": transitions}
+        payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        payload["hash"] = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+        if len(_SNAPSHOT_CACHE) >= 8:
+            _SNAPSHOT_CACHE.clear()
+        entry = (effective, payload)
+        _SNAPSHOT_CACHE[id(effective)] = entry
+    # Deep copy so callers embedding the snapshot in mutable baseline
+    # metadata cannot corrupt the cached payload.
+    return copy.deepcopy(entry[1])
 
 
 def resolve_governance_policy(policy_name: str | None = None) -> GovernancePolicy:
@@ -88,7 +111,9 @@ def set_custom_transition_validator(custom_transition_validator):
 
 
 def utcnow_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Same shape as datetime.now(utc).replace(microsecond=0).isoformat()
+    # via C-level strftime, without allocating two datetime objects per call.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
 
 def _default_metadata(*, include_policy_snapshots: bool = True) -> Dict[str, Any]:
@@ -128,68 +153,135 @@ def _upgrade_legacy_record(data: Dict[str, Any], path: str) -> Dict[str, Any]:
     upgraded = data if ("scenario" in data and "metadata" in data) else {"scenario": data}
     scenario = upgraded.get("scenario")
     if isinstance(scenario, dict):
-        scenario.update({k: v for k, v in _parse_scenario_identity_from_path(path).items() if k not in scenario})
-        scenario.setdefault("input", {})
-        scenario.setdefault("output", {})
+        # One-shot merge, later keys win: defaults < filename identity <
+        # stored fields, so existing values are never overwritten. Leaves
+        # the caller's dicts unmutated.
+        upgraded = {
+            **upgraded,
+            "scenario": {"input": {}, "output": {}, **_parse_scenario_identity_from_path(path), **scenario},
+        }
     return upgraded
 
 
 def _normalize_record(data: Dict[str, Any], path: str) -> BaselineRecord:
     data = _upgrade_legacy_record(data, path)
+    incoming_metadata = data.get("metadata", {})
+    format_version = int(incoming_metadata.get("format_version", BASELINE_FORMAT_VERSION))
     normalized = {
         "scenario": data.get("scenario", {}),
-        "metadata": {**_default_metadata(include_policy_snapshots=False), **data.get("metadata", {})},
+        "metadata": {
+            **_default_metadata(include_policy_snapshots=False),
+            **incoming_metadata,
+            "format_version": format_version,
+        },
         "approval_history": list(data.get("approval_history", [])),
     }
-    normalized["metadata"]["format_version"] = int(normalized["metadata"].get("format_version", BASELINE_FORMAT_VERSION))
-    normalized = _migrate_record_for_version(normalized, normalized["metadata"]["format_version"])
-    if normalized["metadata"]["format_version"] not in SUPPORTED_BASELINE_VERSIONS:
+    normalized = _migrate_record_for_version(normalized, format_version)
+    if format_version not in SUPPORTED_BASELINE_VERSIONS:
         raise BaselineFormatError(
-            f"Unsupported baseline format version: {normalized['metadata']['format_version']} (supported={sorted(SUPPORTED_BASELINE_VERSIONS)})"
+            f"Unsupported baseline format version: {format_version} (supported={sorted(SUPPORTED_BASELINE_VERSIONS)})"
         )
     try:
         validate_baseline_record(normalized)
     except ValueError as exc:
         raise BaselineFormatError(str(exc)) from exc
-    validate_scenario_schema(normalized["scenario"])
+    check_scenario_schema(normalized["scenario"])
     return normalized
 
 
-def load_baseline_record(path: str) -> BaselineRecord:
-    max_baseline_size = get_config().max_baseline_size
-    file_size = os.path.getsize(path)
-    if file_size > max_baseline_size:
+def load_baseline_record(path: str, size: int | None = None, max_size: int | None = None) -> BaselineRecord:
+    """Load one baseline record, enforcing the configured size cap.
+
+    ``size`` lets directory scanners pass the st_size they already have from
+    os.scandir, skipping a second stat syscall per file. ``max_size`` lets
+    loops resolve the configured cap once instead of per record.
+    """
+    max_baseline_size = get_config().max_baseline_size if max_size is None else max_size
+    if size is not None and size > max_baseline_size:
         raise BaselineFormatError(
             f"Baseline file exceeds maximum allowed size ({max_baseline_size} bytes): {path}"
         )
 
-    with open(path, "r", encoding="utf-8") as handle:
+    with open(path, "rb") as handle:
+        # Capped read instead of a getsize syscall: anything past the cap is
+        # rejected before more than max_baseline_size + 1 bytes materialize.
+        raw_bytes = handle.read(max_baseline_size + 1)
+        if len(raw_bytes) > max_baseline_size:
+            raise BaselineFormatError(
+                f"Baseline file exceeds maximum allowed size ({max_baseline_size} bytes): {path}"
+            )
         try:
-            raw = json.load(handle)
-        except json.JSONDecodeError as exc:
+            raw = _fastjson.loads(raw_bytes)
+        except _fastjson.JSONDecodeError as exc:
             raise BaselineFormatError(f"Invalid JSON in baseline file '{path}': {exc}") from exc
     if not isinstance(raw, dict):
         raise BaselineFormatError(f"Baseline file '{path}' must contain a JSON object at top level")
     return _normalize_record(raw, path)
 
 
+# Sidecar index of deprecated baseline basenames. Replay consults it to
+# skip the parse+validate cost of files it would discard anyway; the
+# authoritative status remains scenario_status inside each record, so a
+# missing or stale-by-omission index only costs the old full load. The
+# name has no .json suffix on purpose — directory scanners must not pick
+# it up as a baseline.
+_DEPRECATED_INDEX_NAME = ".deprecated_index"
+
+
+def load_deprecated_index(directory: str) -> set:
+    """Basenames of baselines recorded as deprecated in ``directory``."""
+    try:
+        with open(os.path.join(directory, _DEPRECATED_INDEX_NAME), "rb") as handle:
+            data = _fastjson.loads(handle.read())
+    except (FileNotFoundError, _fastjson.JSONDecodeError):
+        return set()
+    if not isinstance(data, list):
+        return set()
+    return {name for name in data if isinstance(name, str)}
+
+
+def _update_deprecated_index(path: str, deprecated: bool) -> None:
+    directory, name = os.path.split(path)
+    index = load_deprecated_index(directory)
+    if deprecated == (name in index):
+        return
+    if deprecated:
+        index.add(name)
+    else:
+        index.discard(name)
+    payload = _fastjson.dumps_bytes(sorted(index), indent_2=True)
+    with open(os.path.join(directory, _DEPRECATED_INDEX_NAME), "wb") as handle:
+        handle.write(payload)
+
+
 def save_baseline_record(path: str, record: BaselineRecord) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(record, handle, indent=2, sort_keys=True, allow_nan=False)
+    # Serialize once and issue a single write; json.dump would stream many
+    # small writes through the text layer for each record.
+    payload = _fastjson.dumps_bytes(record, sort_keys=True, indent_2=True)
+    with open(path, "wb") as handle:
+        handle.write(payload)
+    # Every write reconciles the deprecated-basename sidecar with the
+    # authoritative scenario_status, so overwriting a deprecated baseline
+    # (e.g. sst record) cannot leave a stale inclusion that replay would
+    # skip without reading the file.
+    _update_deprecated_index(
+        path, record.get("metadata", {}).get("scenario_status") == "deprecated"
+    )
 
 
 def create_baseline_from_capture(capture_data: Dict[str, Any]) -> BaselineRecord:
     capture_data = {"input": {}, "output": {}, **capture_data}
     capture_data.setdefault("engine_version", __version__)
+    approved_at = utcnow_iso()
     return {
         "scenario": capture_data,
         "metadata": {
             **_default_metadata(),
-            "approved_at": utcnow_iso(),
+            "approved_at": approved_at,
             "scenario_status": "approved",
         },
-        "approval_history": [{"approved_at": utcnow_iso(), "action": "record"}],
+        "approval_history": [{"approved_at": approved_at, "action": "record"}],
     }
 
 
@@ -198,6 +290,13 @@ def _decision_id(policy_id: str, action: str, current_status: str) -> str:
     return hashlib.sha256(source.encode("utf-8")).hexdigest()[:12]
 
 
+# In-policy decisions are pure functions of (policy_id, action, status) and
+# GovernanceDecision is frozen, so the dataclass plus its sha256 decision_id
+# can be shared across calls. Unknown transitions stay uncached: they depend
+# on the custom validator hook and the live strict_governance config.
+_DECISION_CACHE: Dict[Tuple[str, str, str], GovernanceDecision] = {}
+
+
 def evaluate_governance_decision(action: str, current_status: str, policy: GovernancePolicy | None = None) -> GovernanceDecision:
     """Return auditable decision details for a governance status transition."""
     policy = policy or resolve_governance_policy()
@@ -235,14 +334,21 @@ def evaluate_governance_decision(action: str, current_status: str, policy: Gover
             policy_id=policy.policy_id,
             decision_id=_decision_id(policy.policy_id, action, current_status),
         )
-    allowed, reason_code, explanation = transition
-    return GovernanceDecision(
-        allowed=allowed,
-        reason_code=reason_code,
-        human_explanation=explanation,
-        policy_id=policy.policy_id,
-        decision_id=_decision_id(policy.policy_id, action, current_status),
-    )
+    cache_key = (policy.policy_id, action, current_status)
+    decision = _DECISION_CACHE.get(cache_key)
+    if decision is None:
+        allowed, reason_code, explanation = transition
+        decision = GovernanceDecision(
+            allowed=allowed,
+            reason_code=reason_code,
+            human_explanation=explanation,
+            policy_id=policy.policy_id,
+            decision_id=_decision_id(policy.policy_id, action, current_status),
+        )
+        if len(_DECISION_CACHE) >= 256:
+            _DECISION_CACHE.clear()
+        _DECISION_CACHE[cache_key] = decision
+    return decision
 
 
 def approve_scenario(path: str, capture_data: Dict[str, Any]) -> BaselineRecord:
@@ -259,29 +365,84 @@ def approve_scenario(path: str, capture_data: Dict[str, Any]) -> BaselineRecord:
     decision = evaluate_governance_decision("approve", record["metadata"].get("scenario_status", "pending"))
     if not decision.allowed:
         raise BaselineFormatError(f"Cannot approve scenario: {decision.reason_code}: {decision.explanation}")
+    approved_at = utcnow_iso()
     record["scenario"] = capture_data
-    record["metadata"]["approved_at"] = utcnow_iso()
+    record["metadata"]["approved_at"] = approved_at
     record["metadata"]["scenario_status"] = "approved"
     record["metadata"]["version_id"] = str(uuid.uuid4())
     record["metadata"]["diff_policy_snapshot"] = diff_policy_snapshot()
     record["metadata"]["governance_policy_snapshot"] = governance_policy_snapshot()
-    record["approval_history"].append({"approved_at": utcnow_iso(), "action": "approve"})
+    record["approval_history"].append({"approved_at": approved_at, "action": "approve"})
     save_baseline_record(path, record)
     return record
 
 
-def list_scenarios(baseline_dir: str) -> List[Dict[str, Any]]:
-    rows = []
-    for path in sorted(glob.glob(os.path.join(baseline_dir, "*.json"))):
-        record = load_baseline_record(path)
-        rows.append(
-            {
-                "scenario_id": _filename_to_scenario_id(os.path.basename(path)),
-                "file": os.path.basename(path),
-                "metadata": record["metadata"],
-            }
+def list_scenarios(baseline_dir: str, shallow: bool = False) -> List[Dict[str, Any]]:
+    """List baseline scenarios with governance metadata.
+
+    ``shallow=True`` derives identity from the filename and attaches file
+    stats instead of parsing each record — O(directory entries) rather than
+    O(total baseline bytes), for callers that only need to enumerate.
+    """
+    try:
+        entries = sorted(
+            (entry for entry in os.scandir(baseline_dir) if entry.name.endswith(".json")),
+            key=lambda entry: entry.name,
         )
-    return rows
+    except FileNotFoundError:
+        return []
+    if shallow:
+        metadatas = []
+        for entry in entries:
+            stat = entry.stat()
+            metadatas.append(
+                {
+                    "size_bytes": stat.st_size,
+                    "modified_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+                }
+            )
+    else:
+        # Each load is an independent open+read+parse+validate, so a thread
+        # pool overlaps the file I/O across baselines; map() preserves order.
+        # DirEntry.stat() reuses the data scandir already fetched, so the
+        # size cap check in load_baseline_record costs no extra syscall.
+        # The cap itself is resolved once for the whole listing.
+        max_size = get_config().max_baseline_size
+        workers = _list_workers(len(entries))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                records = list(
+                    executor.map(
+                        load_baseline_record,
+                        (entry.path for entry in entries),
+                        (entry.stat().st_size for entry in entries),
+                        repeat(max_size),
+                    )
+                )
+        else:
+            records = [load_baseline_record(entry.path, entry.stat().st_size, max_size) for entry in entries]
+        metadatas = [record["metadata"] for record in records]
+    return [
+        {
+            "scenario_id": _filename_to_scenario_id(entry.name),
+            "file": entry.name,
+            "metadata": metadata,
+        }
+        for entry, metadata in zip(entries, metadatas)
+    ]
+
+
+def _list_workers(file_count: int) -> int:
+    try:
+        configured = int(os.getenv("SST_LIST_WORKERS", "0"))
+    except ValueError:
+        configured = 0
+    if configured > 0:
+        return min(configured, file_count)
+    # Small directories are not worth pool startup.
+    if file_count < 8:
+        return 1
+    return min(32, (os.cpu_count() or 1) * 4, file_count)
 
 
 def _filename_to_scenario_id(filename: str) -> str | None:
@@ -3,16 +3,56 @@ DEPRECATED: ShadowCapture produces captures incompatible with the SST
 semantic pipeline. Use SSTCore (@sst.capture) from sst.core instead.
 """
 
+import atexit
 import functools
-import json
 import os
 import inspect
+import queue
+import threading
+import time
 import warnings
 import logging
 from datetime import datetime, timezone
 
+from . import _fastjson
+
 logger = logging.getLogger(__name__)
 
+# Bounds for _serialize_arg: keep captures JSON-native and small instead of
+# repr()-ing arbitrarily large objects into megabyte strings.
+_MAX_ELEMS = 256
+_MAX_REPR_LEN = 2048
+_MAX_ARG_DEPTH = 10
+
+
+def _serialize_arg(value, depth=0):
+    """Serialize one captured argument into JSON-native types.
+
+    Scalars pass through untouched, containers are truncated at _MAX_ELEMS
+    entries, and anything else falls back to a length-capped repr(). This
+    keeps the bytes pushed through the JSON encoder proportional to the
+    configured caps rather than to the size of the caller's objects.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if depth >= _MAX_ARG_DEPTH:
+        return repr(value)[:_MAX_REPR_LEN]
+    if isinstance(value, dict):
+        out = {}
+        for i, (k, v) in enumerate(value.items()):
+            if i >= _MAX_ELEMS:
+                out["__sst_truncated__"] = f"{len(value) - _MAX_ELEMS} more entries"
+                break
+            out[str(k)] = _serialize_arg(v, depth + 1)
+        return out
+    if isinstance(value, (list, tuple)):
+        out = [_serialize_arg(v, depth + 1) for v in value[:_MAX_ELEMS]]
+        if len(value) > _MAX_ELEMS:
+            out.append(f"__sst_truncated__: {len(value) - _MAX_ELEMS} more items")
+        return out
+    return repr(value)[:_MAX_REPR_LEN]
+
+
 class ShadowCapture:
     def __init__(self, storage_dir=".shadow_data"):
         warnings.warn(
@@ -25,24 +65,64 @@ class ShadowCapture:
             stacklevel=2,
         )
         self.storage_dir = storage_dir
+        os.makedirs(storage_dir, exist_ok=True)
+        self._write_queue = None
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
+
+    def _ensure_writer(self):
+        if self._writer_thread is None:
+            with self._writer_lock:
+                if self._writer_thread is None:
+                    self._write_queue = queue.Queue(maxsize=4096)
+                    thread = threading.Thread(target=self._drain_writes, name="sst-shadow-writer", daemon=True)
+                    thread.start()
+                    self._writer_thread = thread
+                    atexit.register(self.flush_writes)
+        return self._write_queue
+
+    def _drain_writes(self):
+        while True:
+            path, payload_bytes = self._write_queue.get()
+            try:
+                with open(path, "wb") as f:
+                    f.write(payload_bytes)
+            except Exception as write_err:
+                logger.warning("ShadowCapture: Failed to write capture data: %s", write_err)
+            finally:
+                self._write_queue.task_done()
+
+    def flush_writes(self):
+        """Block until all queued capture writes have reached disk."""
+        if self._write_queue is not None:
+            self._write_queue.join()
 
     def capture(self, func):
+        # Decoration-time constants: re-reading the source file and attribute
+        # lookups on every call would dominate overhead for fast functions.
+        _mod = func.__module__
+        _name = func.__name__
+        try:
+            _src = inspect.getsource(func)
+        except (OSError, TypeError):
+            _src = None
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            os.makedirs(self.storage_dir, exist_ok=True)
-            
             # Capture inputs
             input_data = {
-                "args": [repr(a) for a in args],
-                "kwargs": {k: repr(v) for k, v in kwargs.items()}
+                "args": [_serialize_arg(a) for a in args],
+                "kwargs": {k: _serialize_arg(v) for k, v in kwargs.items()}
             }
             
-            start_time = datetime.now(timezone.utc)
+            # One wall-clock anchor per call; perf_counter for duration math.
+            captured_at = datetime.fromtimestamp(time.time(), timezone.utc)
+            start_time = time.perf_counter()
             output_data = {"status": "unknown"}
             try:
                 result = func(*args, **kwargs)
-                duration = (datetime.now(timezone.utc) - start_time).total_seconds()
-                
+                duration = time.perf_counter() - start_time
+
                 # Capture output
                 output_data = {
                     "result": repr(result),
@@ -51,7 +131,7 @@ class ShadowCapture:
                 }
                 return result
             except Exception as e:
-                duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 output_data = {
                     "error": str(e),
                     "error_type": type(e).__name__,
@@ -63,17 +143,21 @@ class ShadowCapture:
                 # Save to file
                 try:
                     capture_entry = {
-                        "function": func.__name__,
-                        "module": func.__module__,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "function": _name,
+                        "module": _mod,
+                        "timestamp": captured_at.isoformat(),
                         "input": input_data,
                         "output": output_data,
-                        "source": inspect.getsource(func)
+                        "source": _src
                     }
-                    
-                    filename = f"{func.__module__}.{func.__name__}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S_%f')}.json"
-                    with open(os.path.join(self.storage_dir, filename), "w") as f:
-                        json.dump(capture_entry, f, indent=2)
+
+                    filename = f"{_mod}.{_name}_{captured_at.strftime('%Y%m%d_%H%M%S_%f')}.json"
+                    payload_bytes = _fastjson.dumps_bytes(capture_entry, indent_2=True)
+                    path = os.path.join(self.storage_dir, filename)
+                    try:
+                        self._ensure_writer().put_nowait((path, payload_bytes))
+                    except queue.Full:
+                        logger.warning("ShadowCapture: write queue full, dropping capture %s", filename)
                 except Exception as write_err:
                     logger.warning("ShadowCapture: Failed to write capture data: %s", write_err)
         return wrapper
@@ -8,33 +8,36 @@ Replay guarantees:
 
 from __future__ import annotations
 
-import glob
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
-from . import __version__
+from . import __version__, _fastjson
 from .config import get_config
 from .diff import apply_diff_policy, build_structured_diff, diff_policy_snapshot, format_human_diff, normalize_for_compare, summarize_changes
 from .errors import BaselineValidationError, ReplayDeterminismError, ReplayExecutionError
-from .governance import governance_policy_snapshot, load_baseline_record
+from .governance import _list_workers, governance_policy_snapshot, load_baseline_record, load_deprecated_index
 from .types import BaselineRecord, CaptureScenario, ReplayReport, ReplayScenarioResult, validate_capture_scenario
 
 
-def _load_capture_file(path: str) -> dict:
-    """Read and validate a raw capture payload file."""
-    from .governance import load_baseline_record as _load_baseline
-    import json
+def _load_capture_file(path: str, size: int | None = None, max_size: int | None = None) -> dict:
+    """Read and validate a raw capture payload file.
 
-    max_size = get_config().max_baseline_size
-    if os.path.getsize(path) > max_size:
+    ``size`` lets directory scanners pass the st_size they already have;
+    ``max_size`` lets per-directory loops resolve the configured cap once.
+    """
+    if max_size is None:
+        max_size = get_config().max_baseline_size
+    if (os.path.getsize(path) if size is None else size) > max_size:
         raise ReplayExecutionError(
             f"Capture file exceeds maximum size ({max_size} bytes): {path}"
         )
 
-    with open(path, "r", encoding="utf-8") as file_obj:
+    with open(path, "rb") as file_obj:
         try:
-            data = json.load(file_obj)
-        except json.JSONDecodeError as exc:
+            data = _fastjson.loads(file_obj.read())
+        except _fastjson.JSONDecodeError as exc:
             raise ReplayExecutionError(
                 f"Invalid JSON in capture file '{path}': {exc}"
             ) from exc
@@ -50,6 +53,36 @@ def _load_capture_file(path: str) -> dict:
     return data
 
 
+# Parsed records keyed by path with the (mtime_ns, size) they were read at,
+# so watch/verify loops that replay repeatedly only re-parse files that
+# actually changed. Entries are returned without copying: replay treats
+# loaded records as read-only. Bounded with a wholesale clear like the
+# snapshot caches in diff/governance.
+_RECORD_CACHE: Dict[str, tuple[int, int, dict]] = {}
+_RECORD_CACHE_MAX = 4096
+
+
+@functools.lru_cache(maxsize=8)
+def _engine_warning_for(engine_version: str | None) -> str | None:
+    """Warning text for a baseline engine version, cached per version.
+
+    A replay run typically sees one or two distinct engine versions across
+    all baselines, so the formatted warning is computed once per version
+    rather than once per scenario.
+    """
+    if not engine_version:
+        return (
+            "Baseline missing engine_version metadata — potential reinterpretation risk "
+            f"(current SST v{__version__})."
+        )
+    if engine_version != __version__:
+        return (
+            f"Baseline captured with SST v{engine_version}, current v{__version__} "
+            "— potential reinterpretation risk"
+        )
+    return None
+
+
 class ReplayEngine:
     """Replay scenarios by matching captured input signatures against baseline outputs."""
 
@@ -61,32 +94,85 @@ class ReplayEngine:
         validated = validate_capture_scenario(scenario)
         return f"{validated['module']}.{validated['function']}:{validated['semantic_id']}"
 
+    def _record_key(self, record: dict) -> str:
+        """Scenario key for a loaded record, validated once per record.
+
+        The key is memoized on the record under a private field so repeat
+        replays over cached records skip re-validating identical scenarios.
+        """
+        key = record.get("_scenario_key")
+        if key is None:
+            key = self._scenario_key(record["scenario"])
+            record["_scenario_key"] = key
+        return key
+
+    @staticmethod
+    def _load_files(directory: str, loader, skip_names: frozenset = frozenset()) -> List[tuple[str, dict]]:
+        """Load every *.json file in ``directory``, in name order.
+
+        File I/O and the C-level JSON parse release the GIL, so large
+        directories are loaded through a thread pool; map() preserves
+        order so duplicate detection stays deterministic. ``skip_names``
+        drops files by basename before any open or parse.
+        """
+        try:
+            entries = sorted(
+                (
+                    entry
+                    for entry in os.scandir(directory)
+                    if entry.name.endswith(".json") and entry.name not in skip_names and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+        except FileNotFoundError:
+            return []
+        max_size = get_config().max_baseline_size
+
+        def _load_one(entry):
+            stat = entry.stat()
+            cached = _RECORD_CACHE.get(entry.path)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+            record = loader(entry.path, stat.st_size, max_size=max_size)
+            if len(_RECORD_CACHE) >= _RECORD_CACHE_MAX:
+                _RECORD_CACHE.clear()
+            _RECORD_CACHE[entry.path] = (stat.st_mtime_ns, stat.st_size, record)
+            return record
+
+        workers = _list_workers(len(entries))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(_load_one, entries))
+        else:
+            loaded = [_load_one(entry) for entry in entries]
+        return [(entry.path, record) for entry, record in zip(entries, loaded)]
+
     def _load_baselines(self) -> Dict[str, BaselineRecord]:
         records: Dict[str, BaselineRecord] = {}
         record_files: Dict[str, str] = {}
-        for path in sorted(glob.glob(os.path.join(self.baseline_dir, "*.json"))):
-            record = load_baseline_record(path)
-            scenario = record["scenario"]
+        # Baselines the governance index already marks deprecated are
+        # skipped before parse+validate; the post-load status check below
+        # stays as the authoritative filter for files the index missed.
+        deprecated_names = frozenset(load_deprecated_index(self.baseline_dir))
+        for path, record in self._load_files(self.baseline_dir, load_baseline_record, deprecated_names):
             if record["metadata"].get("scenario_status") == "deprecated":
                 continue
-            key = self._scenario_key(scenario)
-            if key in records:
-                existing_file = record_files[key]
+            key = self._record_key(record)
+            # setdefault hits the hash bucket once: first insert wins, a
+            # returned foreign record means this key was already taken.
+            if records.setdefault(key, record) is not record:
                 raise ReplayExecutionError(
                     f"Duplicate scenario key detected: {key}. "
-                    f"Files: {existing_file} and {os.path.basename(path)}"
+                    f"Files: {record_files[key]} and {os.path.basename(path)}"
                 )
-            records[key] = record
             record_files[key] = os.path.basename(path)
         return records
 
     def _load_captures(self) -> Dict[str, BaselineRecord]:
         records: Dict[str, BaselineRecord] = {}
-        for path in sorted(glob.glob(os.path.join(self.capture_dir, "*.json"))):
-            record = _load_capture_file(path)
-            scenario = record["scenario"]
-            key = self._scenario_key(scenario)
-            if key in records:
+        for path, record in self._load_files(self.capture_dir, _load_capture_file):
+            key = self._record_key(record)
+            if records.setdefault(key, record) is not record:
                 raise ReplayDeterminismError(
                     f"Replay capture is non-deterministic: duplicate scenario key '{key}' in capture artifacts.\n\n"
                     f"Hint: the shadow directory contains captures from multiple runs.\n"
@@ -94,34 +180,40 @@ class ReplayEngine:
                     f"  rm -rf <shadow_dir>/ && python <app.py> && sst verify <app.py>\n"
                     f"Conflicting file: {path}"
                 )
-            records[key] = record
         return records
 
     def normalize_output(self, value: Any) -> Any:
         """Internal replay normalization hook for deterministic comparisons."""
         return normalize_for_compare(apply_diff_policy(value))
 
+    def _baseline_normalized(self, baseline_record: dict, baseline_out: dict, policy_hash: Any) -> Any:
+        """Normalized baseline output, memoized on the cached record.
+
+        Baselines are immutable between replays, and normalization is pure
+        given a diff policy, so the result is stored on the record tagged
+        with the policy snapshot hash — a policy change invalidates it.
+        """
+        cached = baseline_record.get("_normalized_output")
+        if cached is not None and cached[0] == policy_hash:
+            return cached[1]
+        value = self.normalize_output(baseline_out.get("raw_result"))
+        baseline_record["_normalized_output"] = (policy_hash, value)
+        return value
 
-    def _engine_version_warning(self, baseline_scenario: CaptureScenario) -> str | None:
-        baseline_engine_version = baseline_scenario.get("engine_version")
-        if not baseline_engine_version:
-            return (
-                "Baseline missing engine_version metadata — potential reinterpretation risk "
-                f"(current SST v{__version__})."
-            )
-        if baseline_engine_version != __version__:
-            return (
-                f"Baseline captured with SST v{baseline_engine_version}, current v{__version__} "
-                "— potential reinterpretation risk"
-            )
-        return None
 
-    def _policy_drift_messages(self, baseline_record: BaselineRecord) -> list[str]:
+    def _engine_version_warning(self, baseline_scenario: CaptureScenario) -> str | None:
+        return _engine_warning_for(baseline_scenario.get("engine_version"))
+
+    def _policy_drift_messages(
+        self,
+        baseline_record: BaselineRecord,
+        current_diff_snapshot: Dict[str, Any],
+        current_governance: Dict[str, Any],
+    ) -> list[str]:
         messages: list[str] = []
         metadata = baseline_record.get("metadata", {})
 
         baseline_diff_snapshot = metadata.get("diff_policy_snapshot")
-        current_diff_snapshot = diff_policy_snapshot()
         if not baseline_diff_snapshot:
             messages.append("Baseline missing diff_policy_snapshot metadata — policy drift cannot be proven.")
         else:
@@ -138,7 +230,6 @@ class ReplayEngine:
                 )
 
         baseline_governance_snapshot = metadata.get("governance_policy_snapshot")
-        current_governance = governance_policy_snapshot()
         if not baseline_governance_snapshot:
             messages.append("Baseline missing governance_policy_snapshot metadata — governance drift cannot be proven.")
         elif baseline_governance_snapshot.get("hash") != current_governance.get("hash"):
@@ -148,8 +239,12 @@ class ReplayEngine:
 
     def replay(self) -> ReplayReport:
         try:
-            baselines = self._load_baselines()
-            captures = self._load_captures()
+            # The two directory scans are independent; overlap them.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                baseline_future = executor.submit(self._load_baselines)
+                capture_future = executor.submit(self._load_captures)
+                baselines = baseline_future.result()
+                captures = capture_future.result()
         except (BaselineValidationError, ReplayDeterminismError, ReplayExecutionError):
             raise
         except Exception as exc:
@@ -160,9 +255,16 @@ class ReplayEngine:
         scenarios: List[ReplayScenarioResult] = []
         warnings: List[str] = []
 
+        # Runtime policy snapshots are constant for the whole replay; resolve
+        # them once instead of per baseline scenario.
+        current_diff_snapshot = diff_policy_snapshot()
+        current_governance = governance_policy_snapshot()
+        policy_hash = current_diff_snapshot.get("hash")
+
         for key, baseline_record in sorted(baselines.items()):
             baseline_scenario = baseline_record["scenario"]
-            baseline_version = baseline_record["metadata"].get("version_id")
+            baseline_metadata = baseline_record["metadata"]
+            baseline_version = baseline_metadata.get("version_id")
 
             scenario_warnings: List[str] = []
             engine_warning = self._engine_version_warning(baseline_scenario)
@@ -170,7 +272,9 @@ class ReplayEngine:
                 scenario_warnings.append(engine_warning)
                 warnings.append(f"{key}: {engine_warning}")
 
-            drift_messages = self._policy_drift_messages(baseline_record)
+            drift_messages = self._policy_drift_messages(
+                baseline_record, current_diff_snapshot, current_governance
+            )
             for msg in drift_messages:
                 warnings.append(f"{key}: {msg}")
 
@@ -185,10 +289,10 @@ class ReplayEngine:
                             "path": "$.metadata",
                             "change_type": "POLICY_DRIFT",
                             "severity": "high",
-                            "baseline": baseline_record.get("metadata", {}),
+                            "baseline": baseline_metadata,
                             "current": {
-                                "diff_policy_snapshot": diff_policy_snapshot(),
-                                "governance_policy_snapshot": governance_policy_snapshot(),
+                                "diff_policy_snapshot": current_diff_snapshot,
+                                "governance_policy_snapshot": current_governance,
                             },
                         }
                     ],
@@ -199,7 +303,8 @@ class ReplayEngine:
                 scenarios.append(row)
                 continue
 
-            if key not in captures:
+            capture_record = captures.get(key)
+            if capture_record is None:
                 missing.append(key)
                 scenarios.append(
                     {
@@ -214,16 +319,21 @@ class ReplayEngine:
                 )
                 continue
 
-            current_scenario = captures[key]["scenario"]
+            current_scenario = capture_record["scenario"]
             baseline_out = baseline_scenario.get("output", {})
             current_out = current_scenario.get("output", {})
             baseline_status = baseline_out.get("status", "unknown")
             current_status = current_out.get("status", "unknown")
 
             if baseline_status == "success" and current_status == "success":
-                baseline_value = self.normalize_output(baseline_out.get("raw_result"))
+                baseline_value = self._baseline_normalized(baseline_record, baseline_out, policy_hash)
                 current_value = self.normalize_output(current_out.get("raw_result"))
-                changes = build_structured_diff(baseline_value, current_value)
+                # Equal normalized trees cannot produce changes; the C-level
+                # comparison skips the Python diff walk for passing scenarios.
+                if baseline_value == current_value:
+                    changes = []
+                else:
+                    changes = build_structured_diff(baseline_value, current_value)
             elif baseline_status == "failure" and current_status == "failure":
                 baseline_etype = baseline_out.get("error_type", "")
                 current_etype = current_out.get("error_type", "")
@@ -250,9 +360,12 @@ class ReplayEngine:
                     }
                 ]
             else:
-                baseline_value = self.normalize_output(baseline_out.get("raw_result"))
+                baseline_value = self._baseline_normalized(baseline_record, baseline_out, policy_hash)
                 current_value = self.normalize_output(current_out.get("raw_result"))
-                changes = build_structured_diff(baseline_value, current_value)
+                if baseline_value == current_value:
+                    changes = []
+                else:
+                    changes = build_structured_diff(baseline_value, current_value)
 
             if changes:
                 row: ReplayScenarioResult = {
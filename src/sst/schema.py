@@ -24,17 +24,26 @@ class ScenarioSchema:
 
 
 _REQUIRED_FIELDS: tuple[str, ...] = ("module", "function", "semantic_id", "input", "output")
+_REQUIRED_FIELDS_SET: frozenset[str] = frozenset(_REQUIRED_FIELDS)
 
 
-def validate_scenario_schema(scenario: dict[str, Any]) -> ScenarioSchema:
-    """Validate strict required fields and runtime value types for baseline scenarios."""
+def check_scenario_schema(scenario: dict[str, Any]) -> None:
+    """Run the strict scenario checks without building a ScenarioSchema.
+
+    Hot loaders (governance record normalization, capture validation) only
+    need the raise-on-invalid behavior; constructing and discarding a frozen
+    dataclass per record is avoidable allocation on those paths.
+    """
 
     if not isinstance(scenario, dict):
         raise ValidationError("Baseline scenario must be a JSON object")
 
-    for field_name in _REQUIRED_FIELDS:
-        if field_name not in scenario:
-            raise ValidationError(f"Baseline scenario missing required field '{field_name}'")
+    missing = _REQUIRED_FIELDS_SET - scenario.keys()
+    if missing:
+        # One C-level set difference replaces per-field dict probes; report
+        # the first missing field in declared order, as the loop did.
+        field_name = next(name for name in _REQUIRED_FIELDS if name in missing)
+        raise ValidationError(f"Baseline scenario missing required field '{field_name}'")
 
     for field_name in ("module", "function", "semantic_id"):
         value = scenario[field_name]
@@ -67,11 +76,16 @@ def validate_scenario_schema(scenario: dict[str, Any]) -> ScenarioSchema:
             f"Invalid baseline scenario field 'input': expected dict, got {actual}"
         )
 
+
+def validate_scenario_schema(scenario: dict[str, Any]) -> ScenarioSchema:
+    """Validate strict required fields and runtime value types for baseline scenarios."""
+
+    check_scenario_schema(scenario)
     return ScenarioSchema(
         module=scenario["module"],
         function=scenario["function"],
         semantic_id=scenario["semantic_id"],
-        input=input_value,
+        input=scenario["input"],
         output=scenario["output"],
         engine_version=str(scenario.get("engine_version", __version__)),
     )
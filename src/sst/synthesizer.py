@@ -1,11 +1,16 @@
+import ast
+import hashlib
 import json
 import os
-import glob
 import logging
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from . import _fastjson
 from .config import get_config
+from .governance import _list_workers
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +18,67 @@ _MAX_SOURCE_CHARS = 8_000
 _MAX_SCENARIOS_IN_PROMPT = 20
 _MAX_SCENARIO_VALUE_CHARS = 500
 
+def _strip_fences(content: str) -> str:
+    """Strip a surrounding markdown code fence from LLM output, if any."""
+    stripped = content.lstrip()
+    if stripped.startswith("```"):
+        # Drop the whole opening fence line, covering both "```python\n"
+        # and a bare "```\n".
+        newline = stripped.find("\n")
+        if newline != -1:
+            stripped = stripped[newline + 1:]
+    stripped = stripped.rstrip()
+    if stripped.endswith("```"):
+        stripped = stripped[:-3]
+    return stripped.strip()
+
+
+def _synth_cache_dir() -> str:
+    """On-disk cache of generated tests, a sibling of the shadow dir."""
+    shadow_dir = os.path.abspath(get_config().shadow_dir)
+    return os.path.join(os.path.dirname(shadow_dir), ".synth_cache")
+
+
+def _max_scenarios_per_fn() -> int:
+    try:
+        configured = int(os.getenv("SST_MAX_SCENARIOS_PER_FN", "10"))
+    except ValueError:
+        configured = 10
+    return configured if configured > 0 else 10
+
+
+def _llm_workers(group_count: int) -> int:
+    try:
+        configured = int(os.getenv("SST_LLM_CONCURRENCY", "0"))
+    except ValueError:
+        configured = 0
+    if configured > 0:
+        return min(configured, group_count)
+    return min(8, group_count)
+
+
+# Static instruction block shared by every call, kept free of per-function
+# interpolation so the prefix is byte-identical across requests: OpenAI's
+# automatic prompt caching and Anthropic's explicit cache_control both key
+# on exact prefix bytes. Only the user prompt varies per function.
+_SYSTEM_INSTRUCTIONS = """You are a senior Python test engineer. Generate a complete, runnable Pytest test file.
+
+## Instructions
+1. Generate a Pytest file that tests the function under test.
+2. Write one test function per scenario, named `test_<function>_scenario_N`.
+   Captured input uses `args` (positional) and `kwargs` (keyword) — call the function as `func(*input["args"], **input["kwargs"])`.
+3. For success scenarios: assert on the structure and deterministic values of the output dict.
+4. For failure scenarios: use `pytest.raises(ExceptionType)` with the correct exception type.
+5. Use `unittest.mock.patch` to mock any non-deterministic calls (random, datetime, uuid).
+6. Use `freezegun.freeze_time` if output contains timestamps.
+7. Skip assertions on values that are masked strings like `[MASKED_EMAIL]` — only check they are strings.
+8. Include all required imports at the top.
+9. Do NOT use self-correction or retry logic — generate correct code on the first attempt.
+10. Output ONLY valid Python code, no explanations, no markdown fences.
+
+The output must be syntactically valid Python that passes `python -m py_compile`."""
+
+
 _PROVIDER_DEFAULT_MODELS = {
     "openai": "gpt-4o",
     "anthropic": "claude-sonnet-4-20250514",
@@ -27,20 +93,56 @@ class SSTSynthesizer:
         self.base_url = os.getenv("SST_BASE_URL")
         default_model = _PROVIDER_DEFAULT_MODELS.get(self.provider, "gpt-4o")
         self.model = os.getenv("SST_MODEL", default_model)
+        # Lazily built, then reused across run()'s group loop: each client
+        # construction sets up TLS/connection state, and reuse keeps the
+        # underlying HTTP connection pool alive between LLM calls. The lock
+        # guards first construction when run() issues calls concurrently.
+        self._client = None
+        self._client_lock = threading.Lock()
+        # Opt-in reuse of previously generated files; the CLI enables it
+        # unless --no-cache is passed. Off by default for library callers
+        # so programmatic runs always regenerate.
+        self.use_cache = False
 
     def _load_captures(self, func_filter=None):
         shadow_dir = get_config().shadow_dir
-        files = glob.glob(os.path.join(shadow_dir, "*.json"))
-        captures = []
-        for f in files:
+        try:
+            files = sorted(
+                entry.path
+                for entry in os.scandir(shadow_dir)
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        except FileNotFoundError:
+            return []
+        if func_filter:
+            # Core names captures '<module>.<function>_<semantic_id>_...',
+            # so candidates can be narrowed before any open/parse. The
+            # post-parse function check below still applies, so a stray
+            # filename match only costs one parse.
+            marker = f".{func_filter}_"
+            files = [f for f in files if marker in os.path.basename(f)]
+        def _load_one(path):
             try:
-                with open(f, "r", encoding="utf-8") as jf:
-                    data = json.load(jf)
-            except json.JSONDecodeError as e:
-                logger.warning("Skipping corrupted JSON file %s: %s", f, e)
-                continue
+                with open(path, "rb") as jf:
+                    return _fastjson.loads(jf.read())
+            except _fastjson.JSONDecodeError as e:
+                logger.warning("Skipping corrupted JSON file %s: %s", path, e)
+                return None
+
+        # open+read+parse release the GIL, so large shadow dirs load
+        # through a thread pool; map() keeps results in filename order.
+        workers = _list_workers(len(files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(_load_one, files))
+        else:
+            loaded = [_load_one(f) for f in files]
 
-            required = {"function", "module", "semantic_id", "input", "output"}
+        required = {"function", "module", "semantic_id", "input", "output"}
+        captures = []
+        for f, data in zip(files, loaded):
+            if data is None:
+                continue
             missing = required - data.keys()
             if missing:
                 logger.warning("Skipping %s: missing fields %s", f, sorted(missing))
@@ -61,14 +163,27 @@ class SSTSynthesizer:
                 continue
 
             key = f"{module}.{function}"
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(c)
-        return groups
+            # Replays of the same semantic_id describe the same contract;
+            # keying on it keeps one capture per id (the freshest wins) so
+            # duplicated runs do not bloat prompt tokens.
+            groups.setdefault(key, {})[c.get("semantic_id")] = c
+
+        max_per_fn = _max_scenarios_per_fn()
+        result = {}
+        for key, by_id in groups.items():
+            scenarios = list(by_id.values())
+            if len(scenarios) > max_per_fn:
+                logger.info(
+                    "Capping %s scenarios from %d to %d (raise SST_MAX_SCENARIOS_PER_FN to include more).",
+                    key, len(scenarios), max_per_fn,
+                )
+                scenarios = scenarios[:max_per_fn]
+            result[key] = scenarios
+        return result
 
     def _build_prompt(self, func_key, scenarios):
         def _truncate_json(obj, limit=_MAX_SCENARIO_VALUE_CHARS) -> str:
-            text = json.dumps(obj, indent=2)
+            text = _fastjson.dumps_bytes(obj, indent_2=True).decode("utf-8")
             if len(text) > limit:
                 return text[:limit] + f"\n# ... [{len(text) - limit} chars truncated]"
             return text
@@ -91,20 +206,23 @@ class SSTSynthesizer:
             )
             scenarios = scenarios[:_MAX_SCENARIOS_IN_PROMPT]
 
-        scenario_text = ""
+        # Accumulate fragments and join once: += on a growing string copies
+        # the whole buffer per append, quadratic in total prompt size.
+        scenario_parts: list[str] = []
         for i, s in enumerate(scenarios):
             status = s["output"].get("status", "unknown")
-            scenario_text += f"\n--- Scenario {i+1} (status: {status}) ---\n"
-            scenario_text += f"Input: {_truncate_json(s['input'])}\n"
+            scenario_parts.append(f"\n--- Scenario {i+1} (status: {status}) ---\n")
+            scenario_parts.append(f"Input: {_truncate_json(s['input'])}\n")
             if status == "success":
-                scenario_text += f"Expected output: {_truncate_json(s['output'].get('raw_result'))}\n"
+                scenario_parts.append(f"Expected output: {_truncate_json(s['output'].get('raw_result'))}\n")
             else:
-                scenario_text += f"Expected exception: {s['output'].get('error_type', 'Exception')}\n"
-                scenario_text += f"Exception message: {s['output'].get('error', '')[:_MAX_SCENARIO_VALUE_CHARS]}\n"
+                scenario_parts.append(f"Expected exception: {s['output'].get('error_type', 'Exception')}\n")
+                scenario_parts.append(f"Exception message: {s['output'].get('error', '')[:_MAX_SCENARIO_VALUE_CHARS]}\n")
+        scenario_text = "".join(scenario_parts)
 
-        prompt = f"""You are a senior Python test engineer. Generate a complete, runnable Pytest test file.
-
-## Function Under Test
+        # Only the dynamic per-function block; the instruction boilerplate
+        # lives in _SYSTEM_INSTRUCTIONS so providers can cache it.
+        prompt = f"""## Function Under Test
 ```python
 {source}
 ```
@@ -116,29 +234,16 @@ class SSTSynthesizer:
 - Import the function as: from {module_name} import {func_name}
 
 ## Captured Scenarios (PII already masked — do not assert on masked values)
-{scenario_text}
-
-## Instructions
-1. Generate a Pytest file that tests `{func_name}`.
-2. Write one test function per scenario, named `test_{func_name}_scenario_N`.
-   Captured input uses `args` (positional) and `kwargs` (keyword) — call the function as `{func_name}(*input["args"], **input["kwargs"])`.
-3. For success scenarios: assert on the structure and deterministic values of the output dict.
-4. For failure scenarios: use `pytest.raises(ExceptionType)` with the correct exception type.
-5. Use `unittest.mock.patch` to mock any non-deterministic calls (random, datetime, uuid).
-6. Use `freezegun.freeze_time` if output contains timestamps.
-7. Skip assertions on values that are masked strings like `[MASKED_EMAIL]` — only check they are strings.
-8. Include all required imports at the top.
-9. Do NOT use self-correction or retry logic — generate correct code on the first attempt.
-10. Output ONLY valid Python code, no explanations, no markdown fences.
-
-The output must be syntactically valid Python that passes `python -m py_compile`."""
+{scenario_text}"""
 
         return prompt
 
     def _validate_syntax(self, code: str, func_key: str) -> bool:
         """Return True if code is valid Python syntax, False otherwise."""
         try:
-            compile(code, f"<generated:{func_key}>", "exec")
+            # ast.parse stops after AST construction; full compile() would
+            # also generate bytecode we immediately throw away.
+            ast.parse(code, filename=f"<generated:{func_key}>")
             return True
         except SyntaxError as e:
             logger.warning(
@@ -158,69 +263,70 @@ The output must be syntactically valid Python that passes `python -m py_compile`
 
 
     def _call_local_llm(self, prompt):
-        from openai import OpenAI
-
-        if self.base_url:
-            base_url = self.base_url
-        elif self.provider == "ollama":
-            base_url = "http://localhost:11434/v1"
-        elif self.provider == "lmstudio":
-            base_url = "http://localhost:1234/v1"
-        else:
-            raise ValueError(f"Provider '{self.provider}' requires SST_BASE_URL environment variable")
-
-        client = OpenAI(base_url=base_url, api_key="not-needed")
-        response = client.chat.completions.create(
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+
+                    if self.base_url:
+                        base_url = self.base_url
+                    elif self.provider == "ollama":
+                        base_url = "http://localhost:11434/v1"
+                    elif self.provider == "lmstudio":
+                        base_url = "http://localhost:1234/v1"
+                    else:
+                        raise ValueError(f"Provider '{self.provider}' requires SST_BASE_URL environment variable")
+                    self._client = OpenAI(base_url=base_url, api_key="not-needed")
+
+        response = self._client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are a Python test generation expert. Output only valid Python code."},
+                {"role": "system", "content": _SYSTEM_INSTRUCTIONS},
                 {"role": "user", "content": prompt},
             ],
             temperature=0.2,
             max_tokens=4096,
         )
-        content = response.choices[0].message.content
-        if content.startswith("```python"):
-            content = content[len("```python"):].strip()
-        if content.endswith("```"):
-            content = content[:-3].strip()
-        return content
+        return _strip_fences(response.choices[0].message.content)
 
     def _call_openai(self, prompt):
-        from openai import OpenAI
-        client = OpenAI()
-        response = client.chat.completions.create(
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI()
+        response = self._client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are a Python test generation expert. Output only valid Python code."},
+                {"role": "system", "content": _SYSTEM_INSTRUCTIONS},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.2,
             max_tokens=4096,
         )
-        content = response.choices[0].message.content
-        if content.startswith("```python"):
-            content = content[len("```python"):].strip()
-        if content.endswith("```"):
-            content = content[:-3].strip()
-        return content
+        return _strip_fences(response.choices[0].message.content)
 
     def _call_anthropic(self, prompt):
-        import anthropic
-        client = anthropic.Anthropic()
-        response = client.messages.create(
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import anthropic
+                    self._client = anthropic.Anthropic()
+        response = self._client.messages.create(
             model=self.model,
             max_tokens=4096,
+            system=[
+                {
+                    "type": "text",
+                    "text": _SYSTEM_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             messages=[
                 {"role": "user", "content": prompt}
             ]
         )
-        content = response.content[0].text
-        if content.startswith("```python"):
-            content = content[len("```python"):].strip()
-        if content.endswith("```"):
-            content = content[:-3].strip()
-        return content
+        return _strip_fences(response.content[0].text)
 
     def run(self, func_filter=None, output_dir="tests/", open_editor=False):
         captures = self._load_captures(func_filter)
@@ -229,38 +335,85 @@ The output must be syntactically valid Python that passes `python -m py_compile`
             return
 
         groups = self._group_by_function(captures)
-        
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        init_path = os.path.join(output_dir, "__init__.py")
-        if not os.path.exists(init_path):
-            Path(init_path).touch(exist_ok=True)
 
-        for func_key, scenarios in groups.items():
-            logger.info("Generating tests for %s (%d scenarios)...", func_key, len(scenarios))
+        # exist_ok-style calls are atomic and skip the extra stat a
+        # look-before-you-leap exists() check would cost; one Path object
+        # is reused for every output below.
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / "__init__.py").touch(exist_ok=True)
+
+        cache_dir = None
+        if self.use_cache:
+            cache_dir = _synth_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+
+        def _generate_one(item):
+            func_key, scenarios = item
             prompt = self._build_prompt(func_key, scenarios)
-            
+
+            # Identical provider/model/prompt means an identical request;
+            # reuse the previously generated (and already validated) file
+            # instead of paying for a regeneration.
+            cache_path = None
+            if cache_dir is not None:
+                digest = hashlib.blake2b(
+                    f"{self.provider}\x00{self.model}\x00{_SYSTEM_INSTRUCTIONS}\x00{prompt}".encode("utf-8"),
+                    digest_size=16,
+                ).hexdigest()
+                cache_path = os.path.join(cache_dir, f"{digest}.py")
+                try:
+                    with open(cache_path, "r", encoding="utf-8") as fh:
+                        test_code = fh.read()
+                except FileNotFoundError:
+                    pass
+                else:
+                    logger.info("Reusing cached generation for %s", func_key)
+                    return _write_output(func_key, test_code)
+
+            logger.info("Generating tests for %s (%d scenarios)...", func_key, len(scenarios))
+            from_llm = True
             try:
                 test_code = self._call_llm(prompt)
             except Exception as e:
                 logger.warning("LLM call failed for %s: %s", func_key, e)
                 logger.info("Generating fallback template for %s", func_key)
                 test_code = self._generate_fallback(func_key, scenarios)
+                from_llm = False
 
-            if not self._validate_syntax(test_code, func_key):
+            if from_llm and not self._validate_syntax(test_code, func_key):
                 logger.warning("Generated code for %s has syntax errors; falling back to template", func_key)
                 test_code = self._generate_fallback(func_key, scenarios)
+                from_llm = False
 
+            # Fallback templates are cheap to rebuild and would mask a later
+            # successful generation, so only real LLM output is cached.
+            if from_llm and cache_path is not None:
+                with open(cache_path, "w", encoding="utf-8") as fh:
+                    fh.write(test_code)
+
+            return _write_output(func_key, test_code)
+
+        def _write_output(func_key, test_code):
             safe_name = func_key.replace(".", "_")
-            output_path = os.path.join(output_dir, f"test_{safe_name}.py")
-            
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(test_code)
+            output_path = out_dir / f"test_{safe_name}.py"
+            output_path.write_text(test_code, encoding="utf-8")
             logger.info("Written to %s", output_path)
+            return output_path
+
+        # LLM calls dominate wall-clock and are independent per function
+        # group, so keep up to SST_LLM_CONCURRENCY of them in flight.
+        items = list(groups.items())
+        if len(items) > 1:
+            with ThreadPoolExecutor(max_workers=_llm_workers(len(items))) as executor:
+                output_paths = list(executor.map(_generate_one, items))
+        else:
+            output_paths = [_generate_one(item) for item in items]
 
-            if open_editor:
-                editor = os.getenv("EDITOR", "nano")
+        if open_editor:
+            editor = os.getenv("EDITOR", "nano")
+            # Editors are interactive; open them one at a time, in group order.
+            for output_path in output_paths:
                 subprocess.run([editor, output_path])
 
     def _generate_fallback(self, func_key, scenarios):
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
 from .errors import BaselineValidationError
-from .schema import validate_scenario_schema
+from .schema import check_scenario_schema
 
 
 class CaptureOutput(TypedDict, total=False):
@@ -157,7 +157,7 @@ def validate_capture_scenario(scenario: Dict[str, Any]) -> CaptureScenario:
     """
 
     try:
-        validate_scenario_schema(
+        check_scenario_schema(
             {
                 "module": scenario.get("module"),
                 "function": scenario.get("function"),
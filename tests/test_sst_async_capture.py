@@ -43,3 +43,37 @@ def test_async_capture_handles_exception(tmp_path):
     payload = json.loads(files[0].read_text())
     assert payload["output"]["status"] == "failure"
     assert payload["output"]["error_type"] == "ValueError"
+
+
+def test_background_writer_flushes_capture_to_disk(tmp_path):
+    with patch.dict(os.environ, {"SST_ENABLED": "true", "SST_ASYNC_CAPTURE_WRITES": "true"}):
+        core = SSTCore(storage_dir=str(tmp_path), baseline_dir=str(tmp_path / "base"))
+
+        @core.capture
+        def add(a, b):
+            return {"sum": a + b}
+
+        assert add(2, 3) == {"sum": 5}
+        assert core._writer_thread is not None
+        core.flush_writes()
+
+    files = list(tmp_path.glob("*.json"))
+    assert len(files) == 1
+    payload = json.loads(files[0].read_text())
+    assert payload["output"]["status"] == "success"
+    assert payload["output"]["raw_result"] == {"sum": 5}
+
+
+def test_default_capture_writes_inline(tmp_path):
+    with patch.dict(os.environ, {"SST_ENABLED": "true"}):
+        core = SSTCore(storage_dir=str(tmp_path), baseline_dir=str(tmp_path / "base"))
+
+        @core.capture
+        def add(a, b):
+            return {"sum": a + b}
+
+        assert add(2, 3) == {"sum": 5}
+        # No background writer is spun up and the file is readable
+        # immediately, without any flush.
+        assert core._writer_thread is None
+        assert list(tmp_path.glob("*.json"))
@@ -147,3 +147,41 @@ def test_generate_command_emulates_all_generation_inputs(tmp_path, monkeypatch):
     assert os.environ.get("SST_PROVIDER") == original_provider
     assert os.environ.get("SST_MODEL") == original_model
     assert calls == {"func_filter": None, "output_dir": "gen_tests", "open_editor": True}
+
+
+def test_generate_no_cache_flag_controls_synthesizer_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shadow_data = tmp_path / ".shadow_data"
+    shadow_data.mkdir()
+    (shadow_data / "capture.json").write_text("{}", encoding="utf-8")
+
+    seen_use_cache = []
+
+    class FakeSynth:
+        use_cache = False
+
+        def run(self, func_filter, output_dir, open_editor):
+            seen_use_cache.append(self.use_cache)
+
+    monkeypatch.setattr(sst_cli, "SSTSynthesizer", lambda: FakeSynth())
+
+    runner = CliRunner()
+    assert _invoke(runner, ["generate", "--all"]).exit_code == 0
+    assert _invoke(runner, ["generate", "--all", "--no-cache"]).exit_code == 0
+    assert seen_use_cache == [True, False]
+
+
+def test_clean_removes_synth_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shadow_data = tmp_path / ".shadow_data"
+    shadow_data.mkdir()
+    cache_dir = tmp_path / ".synth_cache"
+    cache_dir.mkdir()
+    (cache_dir / "deadbeef.py").write_text("# cached", encoding="utf-8")
+
+    runner = CliRunner()
+    result = _invoke(runner, ["clean"])
+
+    assert result.exit_code == 0
+    assert not shadow_data.exists()
+    assert not cache_dir.exists()
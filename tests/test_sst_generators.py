@@ -224,6 +224,47 @@ class TestSSTSynthesizer:
         content = written[0].read_text()
         assert "import pytest" in content
 
+    def test_generation_cache_skips_identical_regeneration(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        from sst.config import refresh_config
+
+        refresh_config()
+        output_dir = tmp_path / "tests"
+        capture = {
+            "function": "calculate",
+            "module": "myapp.billing",
+            "semantic_id": "abc123",
+            "input": {},
+            "output": {"status": "success"},
+            "source": "def calculate(): pass",
+            "dependencies": [],
+        }
+
+        s = SSTSynthesizer()
+        s.use_cache = True
+        with (
+            patch.object(s, "_load_captures", return_value=[capture]),
+            patch.object(s, "_call_llm", return_value="# generated v1") as mock_llm,
+        ):
+            s.run(output_dir=str(output_dir))
+            s.run(output_dir=str(output_dir))
+
+        # Second run is a cache hit: one LLM call, same output file.
+        assert mock_llm.call_count == 1
+        assert (tmp_path / ".synth_cache").is_dir()
+        assert (output_dir / "test_myapp_billing_calculate.py").read_text() == "# generated v1"
+
+        # With the cache disabled the same prompt regenerates.
+        s2 = SSTSynthesizer()
+        with (
+            patch.object(s2, "_load_captures", return_value=[capture]),
+            patch.object(s2, "_call_llm", return_value="# generated v2") as mock_llm2,
+        ):
+            s2.run(output_dir=str(output_dir))
+
+        assert mock_llm2.call_count == 1
+        assert (output_dir / "test_myapp_billing_calculate.py").read_text() == "# generated v2"
+
     def test_call_llm_raises_on_unknown_provider(self, monkeypatch):
         monkeypatch.setenv("SST_PROVIDER", "unknown_provider")
         s = SSTSynthesizer()
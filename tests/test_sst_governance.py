@@ -37,6 +37,60 @@ def test_approve_and_deprecate_updates_history(tmp_path):
     assert len(updated["approval_history"]) >= 2
 
 
+def test_list_scenarios_shallow_skips_record_parsing(tmp_path):
+    from sst.governance import list_scenarios
+
+    sid = "b" * 32
+    record = create_baseline_from_capture(
+        {"module": "m", "function": "f", "semantic_id": sid, "output": {"raw_result": {"x": 1}}}
+    )
+    (tmp_path / f"m.f_{sid}.json").write_text(json.dumps(record), encoding="utf-8")
+    # Shallow listing must not open the records at all: a corrupt file that
+    # deep listing rejects still gets enumerated from its filename + stat.
+    corrupt_sid = "c" * 32
+    corrupt = tmp_path / f"m.g_{corrupt_sid}.json"
+    corrupt.write_text("not json", encoding="utf-8")
+
+    listed = list_scenarios(str(tmp_path), shallow=True)
+
+    assert [row["scenario_id"] for row in listed] == [f"m.f:{sid}", f"m.g:{corrupt_sid}"]
+    assert listed[1]["file"] == corrupt.name
+    for row in listed:
+        assert set(row["metadata"]) == {"size_bytes", "modified_at"}
+    assert listed[1]["metadata"]["size_bytes"] == len("not json")
+
+    with pytest.raises(BaselineFormatError):
+        list_scenarios(str(tmp_path))
+
+
+def test_rerecord_over_deprecated_baseline_restores_replay_coverage(tmp_path):
+    from sst.governance import load_deprecated_index, save_baseline_record
+    from sst.replay import ReplayEngine
+
+    sid = "a" * 32
+    capture = {
+        "module": "m",
+        "function": "f",
+        "semantic_id": sid,
+        "input": {"args": [], "kwargs": {}},
+        "output": {"raw_result": {"x": 1}, "status": "success"},
+    }
+    path = tmp_path / f"m.f_{sid}.json"
+    engine = ReplayEngine(str(tmp_path), str(tmp_path))
+
+    approve_scenario(str(path), capture)
+    deprecate_scenario(str(path))
+    assert load_deprecated_index(str(tmp_path)) == {path.name}
+    assert engine._load_baselines() == {}
+
+    # sst record overwrites the file with a freshly approved record; the
+    # sidecar entry must go away or replay would keep skipping the file
+    # without ever reading its authoritative scenario_status.
+    save_baseline_record(str(path), create_baseline_from_capture(capture))
+    assert load_deprecated_index(str(tmp_path)) == set()
+    assert f"m.f:{sid}" in engine._load_baselines()
+
+
 def test_reapprove_refreshes_policy_snapshots(tmp_path):
     path = tmp_path / "m.f_abc.json"
     capture = {"module": "m", "function": "f", "semantic_id": "abc", "output": {"raw_result": {"x": 1}}}